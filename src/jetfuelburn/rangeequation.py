@@ -4,6 +4,7 @@ import math
 from typing import Callable
 
 from jetfuelburn.utility.physics import (
+    _G,
     _calculate_atmospheric_density,
     _calculate_airspeed_from_mach,
 )
@@ -11,6 +12,113 @@ from jetfuelburn.utility.code import (
     _validate_physics_function_parameters,
     _normalize_physics_function_or_scalar,
 )
+from jetfuelburn.utility.units import (
+    _KG,
+    _METER,
+    _NEWTON,
+    _METER_PER_SECOND,
+    _SECOND_PER_METER,
+    _DIMENSIONLESS,
+)
+
+
+def _dimensionless_magnitude(value: float | int | pint.Quantity) -> float:
+    r"""
+    Returns the magnitude of a dimensionless value, which may or may not be a `pint.Quantity`.
+    """
+    if isinstance(value, pint.Quantity):
+        return value.m_as(_DIMENSIONLESS)
+    return value
+
+
+def _breguet(
+    R: float,
+    LD: float,
+    m_after_cruise: float,
+    V: float,
+    TSFC: float,
+) -> float:
+    r"""
+    Breguet range equation on plain floats in SI units,
+    as used by [`calculate_fuel_consumption_breguet`][jetfuelburn.rangeequation.calculate_fuel_consumption_breguet].
+
+    Parameters
+    ----------
+    R : float
+        Range of the aircraft [m]
+    LD : float
+        Lift-to-drag ratio [dimensionless]
+    m_after_cruise : float
+        Mass of the aircraft after cruise [kg]
+    V : float
+        Cruise speed [m/s]
+    TSFC : float
+        Thrust Specific Fuel Consumption [kg/(N*s)]
+
+    Returns
+    -------
+    float
+        Required fuel mass [kg]
+    """
+    return m_after_cruise * math.expm1((R * TSFC * _G) / (LD * V))
+
+
+def _integrate_stepclimb(
+    m_after_cruise: float,
+    R: float,
+    V: float,
+    TSFC: float,
+    LD: Callable[[float], float],
+    integration_mass_step: float,
+) -> float:
+    r"""
+    Trapezoidal integration of the specific air range (SAR) on plain floats in SI units,
+    as used by [`calculate_fuel_consumption_stepclimb_integration`][jetfuelburn.rangeequation.calculate_fuel_consumption_stepclimb_integration].
+
+    Notes
+    -----
+    Each step reuses the SAR at the upper mass of the previous step,
+    so that the lift-to-drag function is evaluated once per step.
+
+    Parameters
+    ----------
+    m_after_cruise : float
+        Mass of the aircraft after cruise [kg]
+    R : float
+        Range of the aircraft [m]
+    V : float
+        Cruise speed [m/s]
+    TSFC : float
+        Thrust Specific Fuel Consumption [kg/(N*s)]
+    LD : Callable
+        Lift-to-drag ratio [dimensionless] as a function of aircraft mass [kg]
+    integration_mass_step : float
+        Mass step for numerical integration [kg]
+
+    Returns
+    -------
+    float
+        Required fuel mass [kg]
+    """
+    m_current = m_after_cruise
+    R_current = 0.0
+    SAR_B = (V * LD(m_current)) / (TSFC * m_current * _G)
+
+    while R_current < R:
+        m_next = m_current + integration_mass_step
+        SAR_A = SAR_B
+        SAR_B = (V * LD(m_next)) / (TSFC * m_next * _G)
+        SAR_avg = (SAR_A + SAR_B) / 2
+        R_current += SAR_avg * integration_mass_step
+        m_current = m_next
+
+        if R_current >= R:
+            R_excess = R_current - R
+            m_excess = R_excess / SAR_avg
+            m_current -= m_excess
+            break
+
+    return m_current - m_after_cruise
 
 
 @ureg.check(
@@ -177,30 +285,31 @@ def calculate_fuel_consumption_stepclimb_integration(
     func_TSFC: Callable = _normalize_physics_function_or_scalar(TSFC)
     func_LD: Callable = _normalize_physics_function_or_scalar(LD)
 
-    m_after_cruise = m_after_cruise.to("kg")
+    # Mach number and altitude are constant during cruise, and so are V and TSFC.
     V = _calculate_airspeed_from_mach(mach_number=M, altitude=h)
+    TSFC_value = func_TSFC(M=M, h=h)
 
-    m_current = m_after_cruise
-    R_current = 0 * ureg.km
+    if callable(LD):
 
-    while R_current < R:
-        L_A = m_current * ureg.gravity
-        L_B = (m_current + integration_mass_step) * ureg.gravity
-        SAR_A = (V * func_LD(L=L_A, M=M, h=h)) / (func_TSFC(M=M, h=h) * L_A)
-        SAR_B = (V * func_LD(L=L_B, M=M, h=h)) / (func_TSFC(M=M, h=h) * L_B)
-        SAR_avg = (SAR_A + SAR_B) / 2
-        delta_R = (SAR_avg * integration_mass_step).to("km")
-        R_current += delta_R
-        m_current += integration_mass_step
+        def LD_of_mass(m: float) -> float:
+            L = ureg.Quantity(m * _G, _NEWTON)
+            return _dimensionless_magnitude(func_LD(L=L, M=M, h=h))
 
-        if R_current >= R:
-            R_excess = R_current - R
-            m_excess = R_excess / SAR_avg
-            m_current -= m_excess
-            break
-
-    m_fuel = m_current - m_after_cruise
-    return m_fuel.to("kg")
+    else:
+        LD_value = _dimensionless_magnitude(func_LD())
+
+        def LD_of_mass(m: float) -> float:
+            return LD_value
+
+    m_fuel = _integrate_stepclimb(
+        m_after_cruise=m_after_cruise.m_as(_KG),
+        R=R.m_as(_METER),
+        V=V.m_as(_METER_PER_SECOND),
+        TSFC=TSFC_value.m_as(_SECOND_PER_METER),
+        LD=LD_of_mass,
+        integration_mass_step=integration_mass_step.m_as(_KG),
+    )
+    return ureg.Quantity(m_fuel, _KG)
 
 
 @ureg.check(
@@ -585,19 +694,22 @@ def calculate_fuel_consumption_breguet(
     ```
     """
 
-    if R.magnitude < 0:
+    R = R.m_as(_METER)
+    LD = _dimensionless_magnitude(LD)
+    m_after_cruise = m_after_cruise.m_as(_KG)
+    V = V.m_as(_METER_PER_SECOND)
+    TSFC = TSFC.m_as(_SECOND_PER_METER)
+
+    if R < 0:
         raise ValueError("Range must be greater than zero.")
     if LD <= 1:
         raise ValueError("Lift-to-Drag ratio must be greater than 1.")
-    if m_after_cruise < 0 * ureg.kg:
+    if m_after_cruise < 0:
         raise ValueError("Mass after cruise must be greater than zero.")
-    if V <= 0 * ureg.kph:
+    if V <= 0:
         raise ValueError("Cruise speed must be greater than zero.")
-    if TSFC.magnitude <= 0:
+    if TSFC <= 0:
         raise ValueError("Thrust Specific Fuel Consumption must be greater than zero.")
 
-    if R == 0 * ureg.meter:
-        return 0 * ureg.kg
-    else:
-        m_fuel = m_after_cruise * (math.exp((R * TSFC * ureg.gravity) / (LD * V)) - 1)
-        return m_fuel.to("kg")
+    m_fuel = _breguet(R=R, LD=LD, m_after_cruise=m_after_cruise, V=V, TSFC=TSFC)
+    return ureg.Quantity(m_fuel, _KG)
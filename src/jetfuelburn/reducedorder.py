@@ -5,6 +5,17 @@ import math
 from importlib import resources
 from jetfuelburn import ureg
 from jetfuelburn.utility.physics import _calculate_dynamic_pressure
+from jetfuelburn.utility.units import (
+    _KM,
+    _NMI,
+    _METER,
+    _SQUARE_METER,
+    _METER_PER_SECOND,
+    _PASCAL,
+    _KG,
+    _HOUR,
+    _GRAM_PER_KM,
+)
 
 
 class montlaur_etal:
@@ -72,20 +83,21 @@ class montlaur_etal:
     ```
     """
 
+    # Regression coefficients as magnitudes, for distances in km and F/ASK in g/km
     _REGRESSION_COEFFICIENTS_MODEL_D_E = {
-        "intercept": 34.67 * ureg("dimensionless"),
-        "inv_dist": 6608.0 * ureg("km"),
-        "dist": -1.196e-3 / ureg("km"),
-        "seats": -0.1354 * ureg("dimensionless"),
-        "interaction": 1.338e-5 / ureg("km"),
+        "intercept": 34.67,  # dimensionless
+        "inv_dist": 6608.0,  # km
+        "dist": -1.196e-3,  # 1/km
+        "seats": -0.1354,  # dimensionless
+        "interaction": 1.338e-5,  # 1/km
     }
 
     _REGRESSION_COEFFICIENTS_MODEL_B_D = {
-        "intercept": 0.7361 * ureg("dimensionless"),
-        "inv_dist": 6651.0 * ureg("km"),
-        "dist": 5.989e-4 / ureg("km"),
-        "seats": 6.152e-2 * ureg("dimensionless"),
-        "interaction": -1.014e-6 / ureg("km"),
+        "intercept": 0.7361,  # dimensionless
+        "inv_dist": 6651.0,  # km
+        "dist": 5.989e-4,  # 1/km
+        "seats": 6.152e-2,  # dimensionless
+        "interaction": -1.014e-6,  # 1/km
     }
 
     @staticmethod
@@ -119,17 +131,19 @@ class montlaur_etal:
         ValueError
             If inputs are outside the valid operational bounds and model designation is invalid.
         """
-        d_km = distance.to("km")
+        d_km = distance.m_as(_KM)
 
         if not (50 <= available_seats <= 365):
             raise ValueError(
                 f"Seats available {available_seats} out of range (50 - 365)."
             )
-        if not (100 * ureg.km <= d_km <= 12000 * ureg.km):
-            raise ValueError(f"Distance {d_km} out of range (100 - 12,000 km).")
-        if d_km > 5000 * ureg.km and available_seats < 172:
+        if not (100 <= d_km <= 12000):
+            raise ValueError(
+                f"Distance {ureg.Quantity(d_km, _KM)} out of range (100 - 12,000 km)."
+            )
+        if d_km > 5000 and available_seats < 172:
             raise ValueError("Flights over 5,000 km require at least 172 seats.")
-        if available_seats >= 172 and d_km < 200 * ureg.km:
+        if available_seats >= 172 and d_km < 200:
             raise ValueError(
                 "Flights under 200 km are invalid for aircraft with 172+ seats."
             )
@@ -139,10 +153,7 @@ class montlaur_etal:
             )
 
         if model == "":
-            if (
-                172 <= available_seats <= 365
-                and 200 * ureg.km <= d_km <= 12000 * ureg.km
-            ):
+            if 172 <= available_seats <= 365 and 200 <= d_km <= 12000:
                 model = "B_D"
             else:
                 model = "D_E"
@@ -162,7 +173,7 @@ class montlaur_etal:
             + (beta["interaction"] * d_km * available_seats)
         )
 
-        return fuel_ask_value * ureg("gram / km")
+        return ureg.Quantity(fuel_ask_value, _GRAM_PER_KM)
 
 
 class sacchi_etal:
@@ -285,11 +296,26 @@ class sacchi_etal:
         "b": 0.976183654,  # Dimensionless exponent
         "c": 0.783563064 * ureg.kg / ureg.km,
     }
+
+    # Magnitudes (in kg and km) of the coefficients above,
+    # used by the fixed-point iteration which runs on plain floats.
+    _COEFFICIENTS_LTO = {
+        "a": coefficients_LTO["a"].magnitude,
+        "b": coefficients_LTO["b"],
+    }
+    _COEFFICIENTS_CD = {
+        "a": coefficients_CD["a"].magnitude,
+        "b": coefficients_CD["b"],
+    }
+    _COEFFICIENTS_CRUISE = {
+        "a": coefficients_cruise["a"].magnitude,
+        "b": coefficients_cruise["b"],
+        "c": coefficients_cruise["c"].m_as(_KG / _KM),
+    }
     historical_improvement_rate = -0.006
     future_improvement_rate = -0.008
 
     @staticmethod
-    @ureg.check(None, "[mass]", "[length]")  # year  # TOW  # R
     def _calculate_single_pass(
         year: int,
         TOW: float,
@@ -297,25 +323,24 @@ class sacchi_etal:
     ) -> float:
         """
         Helper function to calculate fuel for a specific given takeoff weight $TOW$ (including fuel).
-        """
-        if year < 2018:
-            raise ValueError("Year must be 2018 or later.")
 
+        Operates on plain floats: $TOW$ in kg and $R$ in km; returns fuel mass in kg.
+        """
         eff_factor_hist = (1 + sacchi_etal.historical_improvement_rate) ** (2018 - 2004)
         years_post_2018 = year - 2018
         eff_factor_future = (1 + sacchi_etal.future_improvement_rate) ** years_post_2018
         total_efficiency_factor = eff_factor_hist * eff_factor_future
 
-        lto_fuel_base = sacchi_etal.coefficients_LTO["a"] * (
-            TOW ** sacchi_etal.coefficients_LTO["b"]
+        lto_fuel_base = sacchi_etal._COEFFICIENTS_LTO["a"] * (
+            TOW ** sacchi_etal._COEFFICIENTS_LTO["b"]
         )
-        cd_fuel_base = sacchi_etal.coefficients_CD["a"] * (
-            TOW ** sacchi_etal.coefficients_CD["b"]
+        cd_fuel_base = sacchi_etal._COEFFICIENTS_CD["a"] * (
+            TOW ** sacchi_etal._COEFFICIENTS_CD["b"]
         )
         cruise_rate_per_km = (
-            sacchi_etal.coefficients_cruise["a"]
-            * (TOW ** sacchi_etal.coefficients_cruise["b"])
-            + sacchi_etal.coefficients_cruise["c"]
+            sacchi_etal._COEFFICIENTS_CRUISE["a"]
+            * (TOW ** sacchi_etal._COEFFICIENTS_CRUISE["b"])
+            + sacchi_etal._COEFFICIENTS_CRUISE["c"]
         )
         cruise_fuel_base = cruise_rate_per_km * R
 
@@ -377,17 +402,16 @@ class sacchi_etal:
                 f"Number of passengers must be between 0 and maximum pax {pax_max}."
             )
 
-        OEW = (
-            0.0927 * pax_max**2 + 253.6 * pax_max * (1 - 0.00174) ** (year - 2004)
-        ) * ureg("kg")
-        payload = pax * 110 * ureg("kg")
-        R = R.to("km") + reserve.to("hr") * 800 * ureg(
-            "km/hr"
+        OEW = 0.0927 * pax_max**2 + 253.6 * pax_max * (1 - 0.00174) ** (
+            year - 2004
+        )  # kg
+        payload = pax * 110  # kg
+        R = (
+            R.m_as(_KM) + reserve.m_as(_HOUR) * 800
         )  # add reserve distance (assuming 800km/h cruise speed)
+        tolerance = tolerance.m_as(_KG)
 
-        fuel_guess = 0.0 * ureg(
-            "kg"
-        )  # initial guess: fuel is 0, or a small fraction of weight
+        fuel_guess = 0.0  # initial guess: fuel is 0, or a small fraction of weight
 
         for i in range(max_iterations):
             current_TOW = OEW + payload + fuel_guess
@@ -395,7 +419,7 @@ class sacchi_etal:
             new_fuel = cls._calculate_single_pass(year, current_TOW, R)
 
             if abs(new_fuel - fuel_guess) < tolerance:
-                return new_fuel
+                return ureg.Quantity(new_fuel, _KG)
 
             fuel_guess = new_fuel
 
@@ -565,8 +589,8 @@ class yanto_etal:
                 f"ICAO Aircraft Designator '{acft}' not found in model data. Please select one of the following: {yanto_etal._regression_coefficients.keys()}"
             )
 
-        R = R.to("km").magnitude
-        PL = PL.to("kg").magnitude
+        R = R.m_as(_KM)
+        PL = PL.m_as(_KG)
 
         m_f = (
             yanto_etal._regression_coefficients[acft]["c_R"] * R
@@ -574,7 +598,7 @@ class yanto_etal:
             + yanto_etal._regression_coefficients[acft]["c_C"]
         )
 
-        return m_f * ureg("kg")
+        return ureg.Quantity(m_f, _KG)
 
 
 class lee_etal:
@@ -910,16 +934,16 @@ class lee_etal:
             )
 
         q = _calculate_dynamic_pressure(speed=V, altitude=h)
-        q = q.to("N/m^2").magnitude
+        q = q.m_as(_PASCAL)
         c = c.magnitude
-        S = S.to("m^2").magnitude
+        S = S.m_as(_SQUARE_METER)
         W_E = W_E.magnitude
         W_MPLD = W_MPLD.magnitude
         W_MTO = W_MTO.magnitude
         W_MF = W_MF.magnitude
-        d = d.to("m").magnitude
-        h = h.to("m").magnitude
-        V = V.to("m/s").magnitude
+        d = d.m_as(_METER)
+        h = h.m_as(_METER)
+        V = V.m_as(_METER_PER_SECOND)
 
         f_res = 0.08  # cf. Section II D of Lee et al.
         f_man = 0.007  # cf. Section II D of Lee et al.
@@ -978,11 +1002,14 @@ class lee_etal:
                     2 * a
                 )  # Eqn.(21) in Lee et al.
 
-        g = 9.8067 * (ureg.m / ureg.s**2)
-        m_f = (W_F * ureg.N) / g
-        m_pld = (W_PLD * ureg.N) / g
+        g = 9.8067  # m/s^2
+        m_f = W_F / g  # N / (m/s^2) = kg
+        m_pld = W_PLD / g  # N / (m/s^2) = kg
 
-        return {"mass_fuel": m_f.to("kg"), "mass_payload": m_pld.to("kg")}
+        return {
+            "mass_fuel": ureg.Quantity(m_f, _KG),
+            "mass_payload": ureg.Quantity(m_pld, _KG),
+        }
 
 
 class seymour_etal:
@@ -1787,14 +1814,14 @@ class seymour_etal:
         if R < 0:
             raise ValueError("Mission range must be non-negative.")
 
-        R = R.to("km").magnitude
+        R = R.m_as(_KM)
 
         m_f = (
             seymour_etal._regression_coefficients[acft]["reduced_fuel_a1"] ** 2 * R
             + seymour_etal._regression_coefficients[acft]["reduced_fuel_a2"] * R
             + seymour_etal._regression_coefficients[acft]["reduced_fuel_intercept"]
         )
-        return m_f * ureg("kg")
+        return ureg.Quantity(m_f, _KG)
 
 
 class aim2015:
@@ -1967,10 +1994,10 @@ class aim2015:
                 "Aircraft size class must be between 1 and 8. Compare the table in the class documentation."
             )
 
-        D_climb = D_climb.to("km").magnitude
-        D_cruise = D_cruise.to("km").magnitude
-        D_descent = D_descent.to("km").magnitude
-        PL = PL.to("kg").magnitude
+        D_climb = D_climb.m_as(_KM)
+        D_cruise = D_cruise.m_as(_KM)
+        D_descent = D_descent.m_as(_KM)
+        PL = PL.m_as(_KG)
 
         m_f_climb = (
             aim2015._regression_coefficients["ClimboutFuel_kg_Intercept"][
@@ -2055,9 +2082,9 @@ class aim2015:
         )
 
         return {
-            "mass_fuel_climb": m_f_climb * ureg("kg"),
-            "mass_fuel_cruise": m_f_cruise * ureg("kg"),
-            "mass_fuel_descent": m_f_descent * ureg("kg"),
+            "mass_fuel_climb": ureg.Quantity(m_f_climb, _KG),
+            "mass_fuel_cruise": ureg.Quantity(m_f_cruise, _KG),
+            "mass_fuel_descent": ureg.Quantity(m_f_descent, _KG),
         }
 
 
@@ -2182,7 +2209,7 @@ class eea_emission_inventory_2009:
             If the range is negative or the range is outside the available data range for the given aircraft.
         """
 
-        R = R.to("nmi").magnitude
+        R = R.m_as(_NMI)
 
         if acft not in eea_emission_inventory_2009._aircraft_data:
             raise ValueError(
@@ -2240,7 +2267,7 @@ class eea_emission_inventory_2009:
 
         dict_fuel_burn_result = {}
         for key, value in dict_fuel_burn.items():
-            dict_fuel_burn_result[f"mass_fuel_{key}"] = value * ureg("kg")
+            dict_fuel_burn_result[f"mass_fuel_{key}"] = ureg.Quantity(value, _KG)
 
         return dict_fuel_burn_result
 
@@ -2361,9 +2388,9 @@ class myclimate:
         float
             Fuel consumption [mass] in kg.
         """
-        if x < (0 * ureg.km):
+        x = x.m_as(_KM)
+        if x < 0:
             raise ValueError("Distance must not be negative.")
-        x = x.to("km").magnitude
 
         if acft in ["A320", "B737"] and x > 2500:
             raise ValueError(f"Aircraft {acft} is not valid for distances > 2500 km.")
@@ -2388,4 +2415,4 @@ class myclimate:
             b = myclimate._regression_coefficients[acft]["b"]
             c = myclimate._regression_coefficients[acft]["c"]
 
-        return (a * x**2 + b * x + c) * ureg.kg
+        return ureg.Quantity(a * x**2 + b * x + c, _KG)
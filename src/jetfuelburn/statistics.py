@@ -4,6 +4,9 @@ from importlib import resources
 import json
 import csv
 from jetfuelburn import ureg
+from jetfuelburn.utility.units import _KM, _KG, _HOUR
+
+_SPECIFIC_ENERGY_JET_FUEL = 43.15  # MJ/kg, https://en.wikipedia.org/wiki/Jet_fuel#Types
 
 
 class aeromaps:
@@ -145,10 +148,9 @@ class aeromaps:
             If the aircraft type (short/medium/long-haul) is not available in the model for the given year.
 
         """
-        if R.magnitude < 0:
+        R = R.m_as(_KM)
+        if R < 0:
             raise ValueError(f"Range must not be negative.")
-        else:
-            R = R.to("km")
         if year not in aeromaps._statistical_data:
             raise ValueError(
                 f"Year '{year}' not found in model data. Please select one of the following: {aeromaps.available_years()}"
@@ -158,14 +160,9 @@ class aeromaps:
                 f"Aircraft type '{acft_type}' not found in model data for year '{year}'. Please select one of the following: {aeromaps.available_aircraft(year)}"
             )
 
-        specific_energy = 43.15 * ureg(
-            "MJ/kg"
-        )  # https://en.wikipedia.org/wiki/Jet_fuel#Types
-        fuel_burn_MJ = (
-            aeromaps._statistical_data[year][acft_type] * R.magnitude
-        )  # in MJ
-        fuel_burn_kg = fuel_burn_MJ * ureg("MJ") / specific_energy  # in kg
-        return fuel_burn_kg.to("kg")
+        fuel_burn_MJ = aeromaps._statistical_data[year][acft_type] * R  # MJ/km * km
+        fuel_burn_kg = fuel_burn_MJ / _SPECIFIC_ENERGY_JET_FUEL  # MJ / (MJ/kg)
+        return ureg.Quantity(fuel_burn_kg, _KG)
 
 
 class usdot:
@@ -358,11 +355,10 @@ class usdot:
             If the year is not available in the model.
             If the aircraft type is not available in the model for the given year.
         """
-        if R.magnitude < 0 or W.magnitude < 0:
+        R = R.m_as(_KM)
+        W = W.m_as(_KG)
+        if R < 0 or W < 0:
             raise ValueError(f"Range and/or weight must not be negative.")
-        else:
-            R = R.to("km")
-            W = W.to("kg")
 
         if year not in usdot._years:
             raise ValueError(f"No data available for year '{year}'.")
@@ -374,11 +370,10 @@ class usdot:
             aircraft_data = usdot._aircraft_data[year][acft]
 
         fuelburn = (
-            (aircraft_data["Fuel/Revenue Weight Distance"] * ureg("1/km")) * R * W
-        )
-        fuelburn = fuelburn.to("kg")
+            aircraft_data["Fuel/Revenue Weight Distance"] * R * W
+        )  # 1/km * km * kg
 
-        return fuelburn
+        return ureg.Quantity(fuelburn, _KG)
 
     @staticmethod
     @ureg.check(
@@ -436,10 +431,9 @@ class usdot:
             If the year is not available in the model.
             If the aircraft type is not available in the model for the given year.
         """
-        if R.magnitude < 0:
+        R = R.m_as(_KM)
+        if R < 0:
             raise ValueError(f"Range must not be negative.")
-        else:
-            R = R.to("km")
 
         if year not in usdot._years:
             raise ValueError(f"No data available for year '{year}'.")
@@ -450,9 +444,8 @@ class usdot:
         else:
             aircraft_data = usdot._aircraft_data[year][acft]
 
-        fuelburn = (aircraft_data["Fuel/Revenue Seat Distance"] * ureg("kg/km")) * R
-        fuelburn = fuelburn.to("kg")
-        return fuelburn
+        fuelburn = aircraft_data["Fuel/Revenue Seat Distance"] * R  # kg/km * km
+        return ureg.Quantity(fuelburn, _KG)
 
     def calculate_movements(
         year: int,
@@ -527,8 +520,7 @@ class usdot:
         else:
             aircraft_data = usdot._aircraft_data[year][acft]
 
-        time = aircraft_data["Average trip flight time"] * ureg("h")
-        time = time.to("h")
+        time = ureg.Quantity(aircraft_data["Average trip flight time"], _HOUR)
         return time
 
     def calculate_average_distance(
@@ -567,8 +559,7 @@ class usdot:
         else:
             aircraft_data = usdot._aircraft_data[year][acft]
 
-        distance = aircraft_data["Average trip distance"] * ureg("km")
-        distance = distance.to("km")
+        distance = ureg.Quantity(aircraft_data["Average trip distance"], _KM)
         return distance
 
     def calculate_average_cargo(
@@ -607,8 +598,7 @@ class usdot:
         else:
             aircraft_data = usdot._aircraft_data[year][acft]
 
-        cargo = aircraft_data["Freight and mail transported"] * ureg("kg")
-        cargo = cargo.to("kg")
+        cargo = ureg.Quantity(aircraft_data["Freight and mail transported"], _KG)
         return cargo
 
     def calculate_average_pax(
@@ -689,4 +679,4 @@ class usdot:
             if data["Fuel/Revenue Seat Distance"] is not None
             and data["Revenue PAX km"] is not None
         )
-        return (total_kg * ureg("kg")).to("kg")
+        return ureg.Quantity(total_kg, _KG)
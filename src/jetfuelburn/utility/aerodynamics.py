@@ -11,6 +11,13 @@ from jetfuelburn.utility.physics import (
 )
 import pint
 from jetfuelburn import ureg
+from jetfuelburn.utility.units import (
+    _METER,
+    _SQUARE_METER,
+    _SQUARE_FEET,
+    _NEWTON,
+    _DIMENSIONLESS,
+)
 
 
 class jsbsim_drag_polars:
@@ -149,7 +156,7 @@ class jsbsim_drag_polars:
 
         data = jsbsim_drag_polars._aircraft_data[acft]
 
-        S = data["wing_area_sqft"] * ureg.square_feet
+        S = ureg.Quantity(data["wing_area_sqft"], _SQUARE_FEET)
         q = _calculate_dynamic_pressure(
             speed=_calculate_airspeed_from_mach(M, h),
             altitude=h,
@@ -180,7 +187,7 @@ class jsbsim_drag_polars:
 
         D = q * S * c_D_total
 
-        return D.to(ureg.newton)
+        return D.to(_NEWTON)
 
     @staticmethod
     @ureg.check(
@@ -252,7 +259,7 @@ class jsbsim_drag_polars:
             h=h,
         )
         L_D_ratio = L / drag
-        L_D_ratio = L_D_ratio.to("dimensionless")
+        L_D_ratio = L_D_ratio.to(_DIMENSIONLESS)
 
         return L_D_ratio
 
@@ -388,7 +395,7 @@ class openap_drag_polars:
                 f"ICAO Aircraft Designator '{acft}' not found in model data."
             )
         data: dict = openap_drag_polars._aircraft_data[acft].copy()
-        data["S"] = data.pop("wing_area_m2") * ureg("m^2")
+        data["S"] = ureg.Quantity(data.pop("wing_area_m2"), _SQUARE_METER)
         return data
 
     @staticmethod
@@ -488,14 +495,14 @@ class openap_drag_polars:
             )
         if M <= 0:
             raise ValueError("Mach number must be greater than zero.")
-        if h < 0 * ureg.meter:
+        if h.m_as(_METER) < 0:
             raise ValueError("Altitude must be greater than or equal to zero.")
-        if L <= 0 * ureg.newton:
+        if L.m_as(_NEWTON) <= 0:
             raise ValueError("Lift force must be greater than zero.")
 
         data = openap_drag_polars._aircraft_data[acft]
 
-        S = data["wing_area_m2"] * ureg("m^2")
+        S = ureg.Quantity(data["wing_area_m2"], _SQUARE_METER)
         q = _calculate_dynamic_pressure(
             speed=_calculate_airspeed_from_mach(M, h), altitude=h
         )
@@ -506,7 +513,7 @@ class openap_drag_polars:
         C_D_total = CD0 + K * (C_L**2)
 
         D = q * S * C_D_total
-        D = D.to("N")
+        D = D.to(_NEWTON)
 
         return D
 
@@ -556,7 +563,7 @@ class openap_drag_polars:
             h=h,
         )
         L_D_ratio = L / drag
-        L_D_ratio = L_D_ratio.to("dimensionless")
+        L_D_ratio = L_D_ratio.to(_DIMENSIONLESS)
         return L_D_ratio
 
     @staticmethod
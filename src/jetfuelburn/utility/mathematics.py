@@ -56,10 +56,15 @@ def _interpolate(
     )
     ```
     """
-    if x_val <= x_list[0]:
-        raise ValueError("x_val is out of bounds (less than minimum x_list value)")
-    if x_val >= x_list[-1]:
-        raise ValueError("x_val is out of bounds (greater than maximum x_list value)")
+    # single chained comparison on the (frequent) in-bounds path;
+    # the individual bounds are only inspected to pick the error message
+    if not (x_list[0] < x_val < x_list[-1]):
+        if x_val <= x_list[0]:
+            raise ValueError("x_val is out of bounds (less than minimum x_list value)")
+        if x_val >= x_list[-1]:
+            raise ValueError(
+                "x_val is out of bounds (greater than maximum x_list value)"
+            )
 
     i = bisect.bisect_right(x_list, x_val)
     x0, x1 = x_list[i - 1], x_list[i]
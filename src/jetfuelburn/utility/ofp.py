@@ -11,6 +11,111 @@ import math
 import json
 from pathlib import Path
 from jetfuelburn import ureg
+from jetfuelburn.utility.units import _FOOT, _FOOT_PER_MINUTE
+
+
+def _load_altitude_bands(
+    perf_data_path: Path | str,
+    aircraft_type: str,
+    phase: str,
+) -> tuple[tuple[float, float, float], ...]:
+    """
+    Read and validate the altitude bands of one aircraft type and flight phase.
+
+    All unit strings are converted once while reading the file.
+    Since the bands are returned as plain floats in the order in which they appear in the file,
+    the altitude lookup in [`_lookup_rate`][jetfuelburn.utility.ofp._lookup_rate]
+    does not need to construct any Pint quantities.
+
+    Parameters
+    ----------
+    perf_data_path : Path | str
+        Path to the JSON file containing aircraft performance data.
+    aircraft_type : str
+        ICAO aircraft type designator, matching a top-level key in the JSON file.
+    phase : str
+        Flight phase; must be either ``'climb'`` or ``'descent'``.
+
+    Returns
+    -------
+    tuple[tuple[float, float, float], ...]
+        One ``(min_alt, max_alt, rate)`` tuple per regime, with altitudes in ``ft``
+        and rates in ``ft/min``.
+
+    Raises
+    ------
+    ValueError
+        See [`_get_aircraft_performance`][jetfuelburn.utility.ofp._get_aircraft_performance].
+    """
+    with open(perf_data_path, "r") as f:
+        data = json.load(f)
+
+    if phase not in ("climb", "descent"):
+        raise ValueError(f"Unknown flight phase: {phase!r}. Use 'climb' or 'descent'.")
+
+    if aircraft_type not in data:
+        available = sorted(data.keys()) if data else []
+        raise ValueError(
+            f"Aircraft type {aircraft_type!r} not found in {perf_data_path}. Available: {available}"
+        )
+
+    aircraft_info = data[aircraft_type]
+    if (
+        aircraft_info is None
+        or phase not in aircraft_info
+        or aircraft_info[phase] is None
+    ):
+        raise ValueError(
+            f"Flight phase {phase!r} not found for aircraft type {aircraft_type!r} in {perf_data_path}"
+        )
+
+    bands = []
+    for r in aircraft_info[phase]:
+        min_alt = ureg(str(r["min_alt"])).m_as(_FOOT)
+        max_alt = ureg(str(r["max_alt"])).m_as(_FOOT)
+        rate = ureg(str(r["rate"])).m_as(_FOOT_PER_MINUTE)
+
+        if min_alt == max_alt:
+            raise ValueError(
+                f"Degenerate altitude band (min == max) in regime {r.get('regime')!r}: {min_alt} foot"
+            )
+
+        bands.append((min(min_alt, max_alt), max(min_alt, max_alt), rate))
+
+    return tuple(bands)
+
+
+def _lookup_rate(
+    bands: tuple[tuple[float, float, float], ...],
+    alt_ft: float,
+    aircraft_type: str,
+    perf_data_path: Path | str,
+) -> float:
+    """
+    Return the rate [ft/min] of the first altitude band containing *alt_ft* [ft].
+
+    Parameters
+    ----------
+    bands : tuple[tuple[float, float, float], ...]
+        Altitude bands as returned by [`_load_altitude_bands`][jetfuelburn.utility.ofp._load_altitude_bands].
+    alt_ft : float
+        Altitude in ``ft``.
+    aircraft_type : str
+        ICAO aircraft type designator, used in the error message only.
+    perf_data_path : Path | str
+        Path to the JSON performance data file, used in the error message only.
+
+    Raises
+    ------
+    ValueError
+        If *alt_ft* does not fall within any of the altitude bands.
+    """
+    for min_alt, max_alt, rate in bands:
+        if min_alt <= alt_ft <= max_alt:
+            return rate
+    raise ValueError(
+        f"Altitude {alt_ft} foot not found in any altitude band for aircraft type {aircraft_type!r} in {perf_data_path}"
+    )
 
 
 @ureg.check(
@@ -112,56 +217,9 @@ def _get_aircraft_performance(
     )
     ```
     """
-    with open(perf_data_path, "r") as f:
-        data = json.load(f)
-
-    if phase not in ("climb", "descent"):
-        raise ValueError(f"Unknown flight phase: {phase!r}. Use 'climb' or 'descent'.")
-
-    if aircraft_type not in data:
-        available = sorted(data.keys()) if data else []
-        raise ValueError(
-            f"Aircraft type {aircraft_type!r} not found in {perf_data_path}. Available: {available}"
-        )
-
-    aircraft_info = data[aircraft_type]
-    if (
-        aircraft_info is None
-        or phase not in aircraft_info
-        or aircraft_info[phase] is None
-    ):
-        raise ValueError(
-            f"Flight phase {phase!r} not found for aircraft type {aircraft_type!r} in {perf_data_path}"
-        )
-
-    regimes = aircraft_info[phase]
-
-    processed = []
-    for r in regimes:
-        min_alt = ureg(str(r["min_alt"])).to("ft")
-        max_alt = ureg(str(r["max_alt"])).to("ft")
-        rate = ureg(str(r["rate"])).to("ft/min")
-
-        if min_alt == max_alt:
-            raise ValueError(
-                f"Degenerate altitude band (min == max) in regime {r.get('regime')!r}: {min_alt}"
-            )
-
-        processed.append(
-            {
-                "regime": r.get("regime"),
-                "min_alt": min(min_alt, max_alt).to("ft"),
-                "max_alt": max(min_alt, max_alt).to("ft"),
-                "rate": rate.to("ft/min"),
-            }
-        )
-
-    for p in processed:
-        if p["min_alt"] <= alt <= p["max_alt"]:
-            return p["rate"]
-    raise ValueError(
-        f"Altitude {alt} not found in any altitude band for aircraft type {aircraft_type!r} in {perf_data_path}"
-    )
+    bands = _load_altitude_bands(perf_data_path, aircraft_type, phase)
+    rate = _lookup_rate(bands, alt.m_as(_FOOT), aircraft_type, perf_data_path)
+    return ureg.Quantity(rate, _FOOT_PER_MINUTE)
 
 
 def generate_4d_trajectory(
@@ -194,11 +252,12 @@ def generate_4d_trajectory(
         string tokens ``'CLB'`` / ``'DSC'`` for climb/descent waypoints whose
         exact altitude is not yet known.
     aircraft_type : str
-        ICAO aircraft type designator (e.g. ``'B123'``), passed directly to
-        :func:`_get_aircraft_performance`.
+        ICAO aircraft type designator (e.g. ``'B123'``), matching a top-level
+        key in the performance data file.
     perf_data_path : Path
-        Path to the JSON performance data file; forwarded to
-        :func:`_get_aircraft_performance`.
+        Path to the JSON performance data file, in the format described in
+        [`_get_aircraft_performance`][jetfuelburn.utility.ofp._get_aircraft_performance].
+        The file is read at most once per flight phase and call, so edits take effect on the next call.
     time_resolution : pint.Quantity, optional
         Resampling resolution as a Pint time quantity (e.g. ``1 * ureg.minute``).
         The output trajectory is resampled to this resolution using linear
@@ -342,6 +401,12 @@ def generate_4d_trajectory(
 
     dt_min = time_resolution.to("min").magnitude
 
+    # convert between the altitude unit and ft once, not at every time step
+    ft_per_alt_unit = ureg.Quantity(1.0, ureg.Unit(unit_alt)).m_as(_FOOT)
+
+    # altitude bands are read from perf_data_path once per call and phase
+    altitude_bands = {}
+
     for idx in range(1, len(df)):
         target_t = df.at[idx, "timestamp"]
         leveloff_target = df.at[idx, "next_alt"]
@@ -370,24 +435,36 @@ def generate_4d_trajectory(
             if strategy == "leveloff":
                 if not math.isclose(curr_alt, leveloff_target, abs_tol=1e-3):
                     if curr_alt < leveloff_target:
-                        rate = _get_aircraft_performance(
-                            perf_data_path=perf_data_path,
-                            aircraft_type=aircraft_type,
-                            phase="climb",
-                            alt=curr_alt * ureg(unit_alt),
+                        if "climb" not in altitude_bands:
+                            altitude_bands["climb"] = _load_altitude_bands(
+                                perf_data_path, aircraft_type, "climb"
+                            )
+                        r_val = (
+                            _lookup_rate(
+                                altitude_bands["climb"],
+                                curr_alt * ft_per_alt_unit,
+                                aircraft_type,
+                                perf_data_path,
+                            )
+                            / ft_per_alt_unit
                         )
-                        r_val = rate.to(f"{unit_alt}/min").magnitude
                         curr_alt += r_val * (step_s / 60.0)
                         if curr_alt > leveloff_target:
                             curr_alt = leveloff_target
                     else:  # descent: hold altitude until TOD, then descend
-                        rate = _get_aircraft_performance(
-                            perf_data_path=perf_data_path,
-                            aircraft_type=aircraft_type,
-                            phase="descent",
-                            alt=curr_alt * ureg(unit_alt),
-                        )
-                        r_val = rate.to(f"{unit_alt}/min").magnitude  # negative
+                        if "descent" not in altitude_bands:
+                            altitude_bands["descent"] = _load_altitude_bands(
+                                perf_data_path, aircraft_type, "descent"
+                            )
+                        r_val = (
+                            _lookup_rate(
+                                altitude_bands["descent"],
+                                curr_alt * ft_per_alt_unit,
+                                aircraft_type,
+                                perf_data_path,
+                            )
+                            / ft_per_alt_unit
+                        )  # negative
                         alt_to_lose = curr_alt - leveloff_target
                         time_needed_s = (alt_to_lose / abs(r_val)) * 60.0
                         if rem_s <= time_needed_s:
@@ -1,6 +1,104 @@
 import math
 import pint
 from jetfuelburn import ureg
+from jetfuelburn.utility.units import (
+    _METER,
+    _KELVIN,
+    _CELSIUS,
+    _KG_PER_M3,
+    _METER_PER_SECOND,
+    _KPH,
+    _PASCAL,
+    _DIMENSIONLESS,
+)
+
+# International Standard Atmosphere (ISA), SI units
+_TEMPERATURE_0 = 288.15  # K, sea-level standard temperature
+_TEMPERATURE_STRATOSPHERE = 216.65  # K, constant temperature in lower stratosphere
+_LAPSE_RATE = 0.0065  # K/m, temperature lapse rate (troposphere)
+_ALTITUDE_TROPOPAUSE = 11000.0  # m
+_ALTITUDE_MAX = 20000.0  # m, upper limit of the implemented model
+_RHO_0 = 1.225  # kg/m^3, sea-level density
+_RHO_1 = 0.36391  # kg/m^3, density at the tropopause
+_G = 9.80665  # m/s^2, gravity
+_R_UNIVERSAL = 8.3144598  # J/(mol*K), universal gas constant
+_M_AIR = 0.0289644  # kg/mol, molar mass of dry air
+_R_AIR = 287.052874  # J/(kg*K), specific gas constant for air
+_GAMMA_AIR = 1.4  # ratio of specific heats for air
+_SPEED_OF_SOUND_0 = 661.479 * 1.852  # km/h (= 661.479 kt), at sea level
+
+
+def _check_altitude(altitude_m: float) -> None:
+    r"""
+    Raises a `ValueError` if the altitude [m] is outside of the range covered by the ISA model implemented here.
+    """
+    if altitude_m < 0:
+        raise ValueError("Altitude must not be < 0.")
+    elif altitude_m > _ALTITUDE_MAX:
+        raise ValueError("Altitude must not be > 20000 m.")
+
+
+def _isa_temperature(altitude_m: float) -> float:
+    r"""
+    Magnitude-only kernel of
+    [`_calculate_atmospheric_temperature`][jetfuelburn.utility.physics._calculate_atmospheric_temperature].
+
+    Parameters
+    ----------
+    altitude_m : float
+        Altitude above sea level [m], already checked to be within bounds.
+
+    Returns
+    -------
+    float
+        Air temperature [K].
+    """
+    if altitude_m <= _ALTITUDE_TROPOPAUSE:
+        return _TEMPERATURE_0 - _LAPSE_RATE * altitude_m
+    return _TEMPERATURE_STRATOSPHERE
+
+
+def _isa_density(altitude_m: float) -> float:
+    r"""
+    Magnitude-only kernel of
+    [`_calculate_atmospheric_density`][jetfuelburn.utility.physics._calculate_atmospheric_density].
+
+    Parameters
+    ----------
+    altitude_m : float
+        Altitude above sea level [m], already checked to be within bounds.
+
+    Returns
+    -------
+    float
+        Air density [kg/m³].
+    """
+    if altitude_m <= _ALTITUDE_TROPOPAUSE:
+        exponent = (_G * _M_AIR / (_R_UNIVERSAL * _LAPSE_RATE)) - 1
+        return _RHO_0 * (_isa_temperature(altitude_m) / _TEMPERATURE_0) ** exponent
+    return _RHO_1 * math.exp(
+        -_G
+        * _M_AIR
+        * (altitude_m - _ALTITUDE_TROPOPAUSE)
+        / (_R_UNIVERSAL * _TEMPERATURE_STRATOSPHERE)
+    )
+
+
+def _isa_speed_of_sound(altitude_m: float) -> float:
+    r"""
+    Speed of sound $\sqrt{\gamma R T(h)}$ at a given altitude.
+
+    Parameters
+    ----------
+    altitude_m : float
+        Altitude above sea level [m], already checked to be within bounds.
+
+    Returns
+    -------
+    float
+        Speed of sound [m/s].
+    """
+    return math.sqrt(_GAMMA_AIR * _R_AIR * _isa_temperature(altitude_m))
 
 
 @ureg.check("[length]")
@@ -57,21 +155,11 @@ def _calculate_atmospheric_temperature(
     _calculate_atmospheric_temperature(altitude=10000*ureg.m)
     ```
     """
-    if altitude < 0 * ureg.m:
-        raise ValueError("Altitude must not be < 0.")
-    elif altitude > 20000 * ureg.m:
-        raise ValueError("Altitude must not be > 20000 m.")
-
-    temperature_0 = 288.15 * ureg.K  # Sea-level standard temperature
-    lapse_rate = 0.0065 * (ureg.K / ureg.m)  # Temperature lapse rate
-    temperature_stratosphere = 216.65 * ureg.K  # Constant temp in lower stratosphere
+    altitude_m = altitude.m_as(_METER)
+    _check_altitude(altitude_m)
 
-    if altitude <= 11000 * ureg.m:
-        temperature = temperature_0 - lapse_rate * altitude
-    else:
-        temperature = temperature_stratosphere
-
-    return temperature.to(ureg.celsius)
+    temperature = ureg.Quantity(_isa_temperature(altitude_m), _KELVIN)
+    return temperature.to(_CELSIUS)
 
 
 @ureg.check("[length]")
@@ -142,33 +230,10 @@ def _calculate_atmospheric_density(
     _calculate_atmospheric_density(altitude=10000*ureg.m)
     ```
     """
-    if altitude < 0 * ureg.m:
-        raise ValueError("Altitude must not be < 0.")
-    elif altitude > 20000 * ureg.m:
-        raise ValueError("Altitude must not be > 20000 m.")
+    altitude_m = altitude.m_as(_METER)
+    _check_altitude(altitude_m)
 
-    rho_0 = 1.225 * (ureg.kg / ureg.m**3)  # Sea-level density
-    rho_1 = 0.36391 * (ureg.kg / ureg.m**3)  # Density at 11,000 m (Tropopause)
-    g = 9.80665 * (ureg.m / ureg.s**2)  # Gravity
-    R = 8.3144598 * ((ureg.N * ureg.m) / (ureg.mol * ureg.K))  # Universal gas constant
-    M = 0.0289644 * (ureg.kg / ureg.mol)  # Molar mass of dry air
-    temperature_0 = 288.15 * ureg.K  # Sea-level standard temperature
-    lapse_rate = 0.0065 * (ureg.K / ureg.m)  # Temperature lapse rate
-    temperature_stratosphere = (
-        216.65 * ureg.K
-    )  # Constant temperature in the lower Stratosphere
-
-    if altitude <= 11000 * ureg.m:
-        current_temp = _calculate_atmospheric_temperature(altitude).to(ureg.K)
-        exponent = (g * M / (R * lapse_rate)) - 1
-        rho = rho_0 * (current_temp / temperature_0) ** exponent
-    else:
-        # This part was already correct
-        rho = rho_1 * math.exp(
-            -g * M * (altitude - 11000 * ureg.m) / (R * temperature_stratosphere)
-        )
-
-    return rho.to(ureg.kg / ureg.m**3)
+    return ureg.Quantity(_isa_density(altitude_m), _KG_PER_M3)
 
 
 @ureg.check(
@@ -227,9 +292,12 @@ def _calculate_dynamic_pressure(
     )
     ```
     """
-    air_density = _calculate_atmospheric_density(altitude)
-    dynamic_pressure = 0.5 * air_density * speed**2
-    return dynamic_pressure.to(ureg.Pa)
+    altitude_m = altitude.m_as(_METER)
+    _check_altitude(altitude_m)
+
+    air_density = _isa_density(altitude_m)
+    dynamic_pressure = 0.5 * air_density * speed.m_as(_METER_PER_SECOND) ** 2
+    return ureg.Quantity(dynamic_pressure, _PASCAL)
 
 
 @ureg.check(
@@ -294,13 +362,14 @@ def _calculate_airspeed_from_mach(
     )
     ```
     """
-    temperature = _calculate_atmospheric_temperature(altitude)
+    altitude_m = altitude.m_as(_METER)
+    _check_altitude(altitude_m)
 
-    R = 287.052874 * (ureg.J / (ureg.kg * ureg.K))  # specific gas constant for air
-    gamma = 1.4 * ureg.dimensionless  # ratio of specific heat for air
-    velocity = mach_number * (gamma * R * temperature.to(ureg.K)) ** 0.5
+    if isinstance(mach_number, ureg.Quantity):
+        mach_number = mach_number.m_as(_DIMENSIONLESS)
+    velocity = mach_number * _isa_speed_of_sound(altitude_m)
 
-    return velocity.to(ureg.kph)
+    return ureg.Quantity(velocity * 3.6, _KPH)  # m/s to km/h
 
 
 @ureg.check(
@@ -360,17 +429,12 @@ def _calculate_mach_from_airspeed(
     )
     ```
     """
-    temperature = _calculate_atmospheric_temperature(altitude)
+    altitude_m = altitude.m_as(_METER)
+    _check_altitude(altitude_m)
 
-    R = 287.052874 * (ureg.J / (ureg.kg * ureg.K))  # specific gas constant for air
-    gamma = 1.4 * ureg.dimensionless  # ratio of specific heat for air
+    mach_number = airspeed.m_as(_METER_PER_SECOND) / _isa_speed_of_sound(altitude_m)
 
-    # Calculate the speed of sound at the given altitude
-    speed_of_sound = (gamma * R * temperature.to(ureg.K)) ** 0.5
-
-    mach_number = airspeed / speed_of_sound
-
-    return mach_number.to(ureg.dimensionless)
+    return ureg.Quantity(mach_number, _DIMENSIONLESS)
 
 
 @ureg.check("[temperature]")
@@ -424,15 +488,12 @@ def _calculate_speed_of_sound(
     ValueError
         If temperature is below absolute zero.
     """
-    T_val = temperature.to(ureg.kelvin)
-    if T_val.magnitude < 0:
+    T_val = temperature.m_as(_KELVIN)
+    if T_val < 0:
         raise ValueError(
             "Temperature must be above absolute zero. If you really did manage to measure a temperature below absolute zero, please contact the JetFuelBurn developers."
         )
 
-    a0 = 661.479 * ureg.knot  # Standard speed of sound at sea level
-    T0 = 288.15 * ureg.kelvin  # Standard sea level temperature
-
-    speed_of_sound = a0 * math.sqrt((T_val / T0).magnitude)
+    speed_of_sound = _SPEED_OF_SOUND_0 * math.sqrt(T_val / _TEMPERATURE_0)
 
-    return speed_of_sound.to(ureg.kph)
+    return ureg.Quantity(speed_of_sound, _KPH)
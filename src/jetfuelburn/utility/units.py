@@ -0,0 +1,23 @@
+from jetfuelburn import ureg
+
+# Units shared by the unit-aware wrappers, looked up once at import.
+# The models convert inputs with `.m_as(unit)` and compute on plain floats.
+_METER = ureg.m
+_KM = ureg.km
+_NMI = ureg.nmi
+_FOOT = ureg.ft
+_SQUARE_METER = ureg.m**2
+_SQUARE_FEET = ureg.square_feet
+_KG = ureg.kg
+_NEWTON = ureg.N
+_PASCAL = ureg.Pa
+_KELVIN = ureg.K
+_CELSIUS = ureg.degC
+_HOUR = ureg.hour
+_KG_PER_M3 = ureg.kg / ureg.m**3
+_METER_PER_SECOND = ureg.m / ureg.s
+_SECOND_PER_METER = ureg.s / ureg.m  # TSFC, kg/(N*s) in SI base units
+_KPH = ureg.kph
+_FOOT_PER_MINUTE = ureg.ft / ureg.min
+_GRAM_PER_KM = ureg.g / ureg.km
+_DIMENSIONLESS = ureg.dimensionless
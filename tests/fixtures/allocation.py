@@ -1,7 +1,7 @@
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def allocation_one_class():
     input_data = {
         "fuel_per_flight": 1000,
@@ -21,7 +21,7 @@ def allocation_one_class():
     return input_data
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def allocation_two_classes():
     input_data = {
         "fuel_per_flight": 1000,
@@ -41,7 +41,7 @@ def allocation_two_classes():
     return input_data
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def allocation_all_classes():
     input_data = {
         "fuel_per_flight": 2000,
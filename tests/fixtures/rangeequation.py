@@ -1,8 +1,10 @@
+from types import MappingProxyType
+
 import pytest
 from jetfuelburn import ureg
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def breguet_range_fuel_calculation_data_1() -> tuple[dict, float]:
     """
     Fixture returning test data.
@@ -35,3 +37,62 @@ def breguet_range_fuel_calculation_data_1() -> tuple[dict, float]:
     }
     expected_data = 30000 * ureg.kg
     return input_data, expected_data
+
+
+@pytest.fixture(scope="module")
+def breguet_base_params() -> MappingProxyType:
+    """
+    Fixture returning a read-only set of valid inputs for
+    `calculate_fuel_consumption_breguet`.
+    Tests override single entries with `{**breguet_base_params, **overrides}`.
+    """
+    return MappingProxyType(
+        {
+            "R": 2000 * ureg.nmi,
+            "LD": 18,
+            "m_after_cruise": 100 * ureg.metric_ton,
+            "V": 800 * ureg.kph,
+            "TSFC": 17 * (ureg.mg / ureg.N / ureg.s),
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def stepclimb_arctan_base_params() -> MappingProxyType:
+    """
+    Fixture returning a read-only set of valid inputs for
+    `calculate_fuel_consumption_stepclimb_arctan`.
+    Tests override single entries with `{**stepclimb_arctan_base_params, **overrides}`.
+    """
+    return MappingProxyType(
+        {
+            "R": 2000 * ureg.nmi,
+            "h": 35000 * ureg.feet,
+            "K": 0.045,
+            "C_D0": 0.02,
+            "m_after_cruise": 100 * ureg.metric_ton,
+            "S": 122.6 * ureg.meter**2,
+            "V": 800 * ureg.kph,
+            "TSFC": 17 * (ureg.mg / ureg.N / ureg.s),
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def stepclimb_integration_base_params() -> MappingProxyType:
+    """
+    Fixture returning a read-only set of valid inputs for
+    `calculate_fuel_consumption_stepclimb_integration`.
+    Tests override single entries with `{**stepclimb_integration_base_params, **overrides}`.
+    """
+    return MappingProxyType(
+        {
+            "m_after_cruise": 100 * ureg.metric_ton,
+            "R": 2000 * ureg.nmi,
+            "h": 35000 * ureg.feet,
+            "M": 0.78,
+            "TSFC": 17 * (ureg.mg / ureg.N / ureg.s),
+            "LD": 18,
+            "integration_mass_step": 100 * ureg.kg,
+        }
+    )
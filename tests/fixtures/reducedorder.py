@@ -1,13 +1,19 @@
 import pytest
 from jetfuelburn import ureg
 
+AIM2015_B787_CASES = {
+    5000 * ureg.km: 25606 * ureg.kg,
+    10000 * ureg.km: 53636 * ureg.kg,
+    15000 * ureg.km: 84242 * ureg.kg,
+}
+
 
 @pytest.fixture(scope="module")
 def fixture_aim2015_B787():
     """
     Fixture returning a factory function to generate test cases.
 
-    The `cases` dictionary contains:
+    The `AIM2015_B787_CASES` dictionary contains:
     - `key`: range [km]
     - `value`: expected value for calculated fuel burn [kg]
 
@@ -31,20 +37,20 @@ def fixture_aim2015_B787():
         "PL": (359 * 95 + 4500) * ureg.kg,
     }
 
-    cases = {
-        5000 * ureg.km: 25606 * ureg.kg,
-        10000 * ureg.km: 53636 * ureg.kg,
-        15000 * ureg.km: 84242 * ureg.kg,
-    }
-
     def _make_case(d):
-        if d not in cases:
+        if d not in AIM2015_B787_CASES:
             raise ValueError(f"No expected output defined for d={d}")
         input_data = base_data | {"D_cruise": d - (200 + 200) * ureg.km}
-        expected_output = cases[d]
+        expected_output = AIM2015_B787_CASES[d]
         return input_data, expected_output
 
-    return _make_case, list(cases.keys())
+    return _make_case
+
+
+SEYMOUR_B738_CASES = {
+    902 * ureg.km: 4008 * ureg.kg,
+    5557 * ureg.km: 16728 * ureg.kg,
+}
 
 
 @pytest.fixture(scope="module")
@@ -52,7 +58,7 @@ def fixture_seymour_B738():
     """
     Fixture returning a factory function to generate test cases.
 
-    The `cases` dictionary contains:
+    The `SEYMOUR_B738_CASES` dictionary contains:
     - `key`: range [km]
     - `value`: expected value for calculated fuel burn [kg]
 
@@ -68,19 +74,20 @@ def fixture_seymour_B738():
         "acft": "B738",
     }
 
-    cases = {
-        902 * ureg.km: 4008 * ureg.kg,
-        5557 * ureg.km: 16728 * ureg.kg,
-    }
-
     def _make_case(r):
-        if r not in cases:
+        if r not in SEYMOUR_B738_CASES:
             raise ValueError(f"No expected output defined for r={r}")
         input_data = base_data | {"R": r}
-        expected_output = cases[r]
+        expected_output = SEYMOUR_B738_CASES[r]
         return input_data, expected_output
 
-    return _make_case, list(cases.keys())
+    return _make_case
+
+
+YANTO_B739_CASES = {
+    (4724 * ureg.km, 17918 * ureg.kg): 15807 * ureg.kg,
+    (2943 * ureg.km, 7885 * ureg.kg): 8878 * ureg.kg,
+}
 
 
 @pytest.fixture(scope="module")
@@ -88,7 +95,7 @@ def fixture_yanto_B739():
     """
     Fixture returning a factory function to generate test cases.
 
-    The `cases` dictionary contains:
+    The `YANTO_B739_CASES` dictionary contains:
     - `key`: range [km]
     - `value`: expected value for calculated fuel burn [kg]
 
@@ -104,20 +111,21 @@ def fixture_yanto_B739():
         "acft": "B739",
     }
 
-    cases = {
-        (4724 * ureg.km, 17918 * ureg.kg): 15807 * ureg.kg,
-        (2943 * ureg.km, 7885 * ureg.kg): 8878 * ureg.kg,
-    }
-
     def _make_case(r, pl):
         key = (r, pl)
-        if key not in cases:
+        if key not in YANTO_B739_CASES:
             raise ValueError(f"No expected output defined for r={r}, pl={pl}")
         input_data = base_data | {"R": r, "PL": pl}
-        expected_output = cases[key]
+        expected_output = YANTO_B739_CASES[key]
         return input_data, expected_output
 
-    return _make_case, list(cases.keys())
+    return _make_case
+
+
+LEE_B732_CASES = {
+    1500 * ureg.nmi: (26288 * ureg.lbs).to("kg"),
+    2000 * ureg.nmi: (9500 * ureg.lbs).to("kg"),
+}
 
 
 @pytest.fixture(scope="module")
@@ -125,7 +133,7 @@ def fixture_lee_B732():
     """
     Fixture returning a factory function to generate test cases.
 
-    The `cases` dictionary contains:
+    The `LEE_B732_CASES` dictionary contains:
     - `key`: range [km]
     - `value`: expected value for calculated fuel burn [kg]
 
@@ -151,19 +159,20 @@ def fixture_lee_B732():
         "V": 807.65 * ureg.kph,
     }
 
-    cases = {
-        1500 * ureg.nmi: (26288 * ureg.lbs).to("kg"),
-        2000 * ureg.nmi: (9500 * ureg.lbs).to("kg"),
-    }
-
     def _make_case(d):
-        if d not in cases:
+        if d not in LEE_B732_CASES:
             raise ValueError(f"No expected output defined for d={d}")
         input_data = base_data | {"d": d}
-        expected_output = cases[d]
+        expected_output = LEE_B732_CASES[d]
         return input_data, expected_output
 
-    return _make_case, list(cases.keys())
+    return _make_case
+
+
+EEA_A320_CASES = {
+    1000 * ureg.nmi: 6027.22755694583 * ureg.kg,
+    1300 * ureg.nmi: 7547.557937 * ureg.kg,
+}
 
 
 @pytest.fixture(scope="module")
@@ -171,7 +180,7 @@ def fixture_eea_A320():
     """
     Fixture returning a factory function to generate test cases.
 
-    The `cases` dictionary contains:
+    The `EEA_A320_CASES` dictionary contains:
     - `key`: range [km]
     - `value`: expected value for calculated fuel burn [kg] ("total" segment only!)
 
@@ -187,19 +196,21 @@ def fixture_eea_A320():
         "acft": "A320",
     }
 
-    cases = {
-        1000 * ureg.nmi: 6027.22755694583 * ureg.kg,
-        1300 * ureg.nmi: 7547.557937 * ureg.kg,
-    }
-
     def _make_case(R):
-        if R not in cases:
+        if R not in EEA_A320_CASES:
             raise ValueError(f"No expected output defined for R={R}")
         input_data = base_data | {"R": R}
-        expected_output = cases[R]
+        expected_output = EEA_A320_CASES[R]
         return input_data, expected_output
 
-    return _make_case, list(cases.keys())
+    return _make_case
+
+
+MYCLIMATE_STANDARD_CASES = {
+    1000 * ureg.km: 4040 * ureg.kg,
+    2000 * ureg.km: 9100 * ureg.kg,
+    2500 * ureg.km: 13750 * ureg.kg,
+}
 
 
 @pytest.fixture(scope="module")
@@ -207,7 +218,7 @@ def fixture_myclimate_standard():
     """
     Fixture returning a factory function to generate test cases for myclimate A320.
 
-    The `cases` dictionary contains:
+    The `MYCLIMATE_STANDARD_CASES` dictionary contains:
     - `key`: distance [km]
     - `value`: expected value for calculated fuel burn [kg]
 
@@ -230,17 +241,11 @@ def fixture_myclimate_standard():
         "acft": "A320",
     }
 
-    cases = {
-        1000 * ureg.km: 4040 * ureg.kg,
-        2000 * ureg.km: 9100 * ureg.kg,
-        2500 * ureg.km: 13750 * ureg.kg,
-    }
-
     def _make_case(x):
-        if x not in cases:
+        if x not in MYCLIMATE_STANDARD_CASES:
             raise ValueError(f"No expected output defined for x={x}")
         input_data = base_data | {"x": x}
-        expected_output = cases[x]
+        expected_output = MYCLIMATE_STANDARD_CASES[x]
         return input_data, expected_output
 
-    return _make_case, list(cases.keys())
+    return _make_case
@@ -1,9 +1,15 @@
 import pytest
-from jetfuelburn.utility.geography import _atlas, _calculate_haversine_distance
+from jetfuelburn.utility.geography import (
+    _AirportAtlas,
+    _atlas,
+    _calculate_haversine_distance,
+)
 from jetfuelburn import ureg
 from jetfuelburn.utility.tests import approx_with_units
 import math
 
+KM = ureg.km
+
 
 class TestGeography:
 
@@ -65,6 +71,13 @@ class TestGeography:
         with pytest.raises(ValueError, match="Invalid identifier type"):
             _atlas._get_airport("OMDB", by="zipcode")
 
+    def test_invalid_key_does_not_load_data(self):
+        """Test that an invalid 'by' parameter is rejected before the dataset is loaded."""
+        atlas = _AirportAtlas()
+        with pytest.raises(ValueError, match="Invalid identifier type"):
+            atlas._get_airport("OMDB", by="zipcode")
+        assert atlas._loaded is False
+
     def test_data_loaded_state(self):
         """Test that the atlas flags itself as loaded after a request."""
         # Ensure data is loaded
@@ -101,30 +114,30 @@ class TestHaversine:
     def test_calculate_haversine_distance_noaa_examples(self):
         """Test haversine distance against NOAA Calculator (https://www.nhc.noaa.gov/gccalc.shtml)."""
         assert approx_with_units(
-            _calculate_haversine_distance(0, 10, 0, 0), 1111 * ureg.km, rel=0.01
+            _calculate_haversine_distance(0, 10, 0, 0), 1111 * KM, rel=0.01
         )
         assert approx_with_units(
-            _calculate_haversine_distance(0, 180, 0, 0), 20002 * ureg.km, rel=0.01
+            _calculate_haversine_distance(0, 180, 0, 0), 20002 * KM, rel=0.01
         )
         assert approx_with_units(
-            _calculate_haversine_distance(0, 180, 33, 66), 12217 * ureg.km, rel=0.01
+            _calculate_haversine_distance(0, 180, 33, 66), 12217 * KM, rel=0.01
         )
 
     def test_calculate_haversine_distance_zero_distance(self):
         """Test haversine distance for the same point."""
         distance = _calculate_haversine_distance(10, 20, 10, 20)
-        assert approx_with_units(distance, 0 * ureg.km, abs=1e-6 * ureg.km)
+        assert approx_with_units(distance, 0 * KM, abs=1e-6 * KM)
 
     def test_calculate_haversine_distance_known_distance(self):
         """Test haversine distance between ZRH and SFO."""
         # Zurich (ZRH): 47.4647 N, 8.5492 E
         # San Francisco (SFO): 37.6188 N, 122.375 W
         distance = _calculate_haversine_distance(47.4647, 8.5492, 37.6188, -122.375)
-        assert approx_with_units(distance, 9370 * ureg.km, rel=0.01)
+        assert approx_with_units(distance, 9370 * KM, rel=0.01)
 
     def test_calculate_haversine_distance_antipodal(self):
         """Test haversine distance between antipodal points."""
         distance = _calculate_haversine_distance(0, 0, 0, 180)
-        R = 6371.0 * ureg.km  # km
+        R = 6371.0 * KM  # km
         expected_distance = math.pi * R
         assert approx_with_units(distance, expected_distance, rel=0.01)
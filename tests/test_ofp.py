@@ -8,7 +8,10 @@ import pandas as pd
 import pytest
 
 from jetfuelburn import ureg
-from jetfuelburn.utility.ofp import _get_aircraft_performance, generate_4d_trajectory
+from jetfuelburn.utility.ofp import (
+    _get_aircraft_performance,
+    generate_4d_trajectory,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers / shared fixtures
@@ -118,6 +121,22 @@ class TestGetAircraftPerformance:
         rate = _get_aircraft_performance(DATA_JSON, "B123", "descent", 30000 * ureg.ft)
         assert rate.to("ft/min").magnitude < 0
 
+    def test_edited_json_is_picked_up(
+        self,
+        tmp_path: Path,
+    ):
+        """Rates are re-read from the JSON file, so edits take effect on the next lookup."""
+        perf_json = tmp_path / "performance.json"
+        perf_json.write_text(PERF_JSON.read_text())
+        rate = _get_aircraft_performance(perf_json, "TEST", "climb", 20000 * ureg.ft)
+        assert math.isclose(rate.to("ft/min").magnitude, 500.0)
+
+        perf_json.write_text(
+            PERF_JSON.read_text().replace('"500 ft/min"', '"750 ft/min"')
+        )
+        rate = _get_aircraft_performance(perf_json, "TEST", "climb", 20000 * ureg.ft)
+        assert math.isclose(rate.to("ft/min").magnitude, 750.0)
+
     # --- error handling ----------------------------------------------------
 
     def test_invalid_phase_raises(
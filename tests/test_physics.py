@@ -1,3 +1,6 @@
+import math
+import re
+from functools import partial
 from pathlib import Path
 import pytest
 import csv
@@ -9,6 +12,9 @@ from jetfuelburn.utility.physics import (
     _calculate_airspeed_from_mach,
     _calculate_mach_from_airspeed,
     _calculate_speed_of_sound,
+    _isa_temperature,
+    _isa_density,
+    _isa_speed_of_sound,
 )
 
 from jetfuelburn.utility.tests import approx_with_units
@@ -18,7 +24,7 @@ def load_isa_csv():
     r"""
     Helper function to load a CSV file containing
     parameters of the International Standard Atmosphere (ISA).
-    Returns a list of dictionaries where values are float-converted.
+    Returns a dictionary of columns where values are float-converted.
 
     References
     ----------
@@ -33,171 +39,117 @@ def load_isa_csv():
 
     Returns
     -------
-    List[Dict[str, float]]
-        A list of dictionaries with ISA parameters, where each dictionary corresponds to a row in the CSV file.
+    Dict[str, Tuple[float, ...]]
+        A dictionary with ISA parameters, where each key corresponds to a column in the CSV file
+        and each value holds the column values of all rows (in file order).
         Of the form:
         ```
-        [
-            {
-                'H_ft': 0.0,
-                'H_m': 0.0,
-                'theta': 1.0,
-                'T_K': 288.15,
-                'T_C': 15.0,
-                'delta': 1.0,
-                'P_N/m^2': 101325.0,
-                'P_lb/ft^2': 2116.21,
-                'sigma': 1.0,
-                'rho_kg/m^3': 1.225,
-                'rho_slug/ft^3': 0.002377,
-                'a_m/s': 340.3,
-                'a_ft/s': 1116.0,
-                'a_kt': 661.5
-            },
-            ...
-        ]
+        {
+            'H_ft': (0.0, 200.0, ...),
+            'H_m': (0.0, 61.0, ...),
+            'theta': (1.0, 0.9986, ...),
+            'T_K': (288.15, 287.75, ...),
+            'T_C': (15.0, 14.6, ...),
+            'delta': (1.0, 0.9928, ...),
+            'P_N/m^2': (101325.0, 100595.0, ...),
+            'P_lb/ft^2': (2116.21, 2101.0, ...),
+            'sigma': (1.0, 0.9942, ...),
+            'rho_kg/m^3': (1.225, 1.2178, ...),
+            'rho_slug/ft^3': (0.002377, 0.002363, ...),
+            'a_m/s': (340.3, 340.1, ...),
+            'a_ft/s': (1116.0, 1116.0, ...),
+            'a_kt': (661.5, 661.0, ...)
+        }
         ```
     """
     csv_path = Path(__file__).parent / "data" / "isa.csv"
-    data = []
     with open(csv_path, mode="r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            clean_row = {k: float(v) for k, v in row.items()}
-            data.append(clean_row)
+        reader = csv.reader(f)
+        header = next(reader)
+        columns = zip(*reader)
+        data = {
+            name: tuple(float(value) for value in column)
+            for name, column in zip(header, columns)
+        }
     return data
 
 
 ISA_DATA = load_isa_csv()
 
-
-def load_isa_csv():
-    r"""
-    Helper function to load a CSV file containing
-    parameters of the International Standard Atmosphere (ISA).
-    Returns a list of dictionaries where values are float-converted.
-
-    References
-    ----------
-    "International Standard Atmosphere (ISA) Table" in Young, T. M. (2017).
-    _Performance of the Jet Transport Airplane: Analysis Methods, Flight Operations, and Regulations._
-    John Wiley & Sons.
-    doi:[10.1002/9781118534786.app1](https://doi.org/10.1002/9781118534786.app1)
-
-    See Also
-    --------
-    [International Standard Atmosphere (ISA) entry on Wikipedia](https://en.wikipedia.org/wiki/International_Standard_Atmosphere)
-
-    Returns
-    -------
-    List[Dict[str, float]]
-        A list of dictionaries with ISA parameters, where each dictionary corresponds to a row in the CSV file.
-        Of the form:
-        ```
-        [
-            {
-                'H_ft': 0.0,
-                'H_m': 0.0,
-                'theta': 1.0,
-                'T_K': 288.15,
-                'T_C': 15.0,
-                'delta': 1.0,
-                'P_N/m^2': 101325.0,
-                'P_lb/ft^2': 2116.21,
-                'sigma': 1.0,
-                'rho_kg/m^3': 1.225,
-                'rho_slug/ft^3': 0.002377,
-                'a_m/s': 340.3,
-                'a_ft/s': 1116.0,
-                'a_kt': 661.5
-            },
-            ...
-        ]
-        ```
-    """
-    csv_path = Path(__file__).parent / "data" / "isa.csv"
-    data = []
-    with open(csv_path, mode="r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            clean_row = {k: float(v) for k, v in row.items()}
-            data.append(clean_row)
-    return data
-
-
-ISA_DATA = load_isa_csv()
+# Pint quantities are built once at import, not inside every table test
+ISA_ALTITUDES = [ureg.Quantity(h, ureg.meter) for h in ISA_DATA["H_m"]]
+ISA_TEMPERATURES = [ureg.Quantity(t, ureg.degC) for t in ISA_DATA["T_C"]]
+ISA_DENSITIES = [
+    ureg.Quantity(rho, ureg.kg / ureg.m**3) for rho in ISA_DATA["rho_kg/m^3"]
+]
+KT_TO_KPH = ureg.Quantity(1.0, ureg.knot).m_as(ureg.kph)
+ISA_SPEEDS_OF_SOUND = [ureg.Quantity(a * KT_TO_KPH, ureg.kph) for a in ISA_DATA["a_kt"]]
+MACH_ONE = ureg.Quantity(1.0, ureg.dimensionless)
+ALTITUDE_ERROR = re.compile(r"Altitude must not be")
 
 
 class TestCalculateAtmosphericTemperature:
     """Test suite for _calculate_atmospheric_temperature."""
 
-    @pytest.mark.parametrize("row", ISA_DATA)
-    def test_values_against_isa_table(
-        self,
-        row,
-    ):
-        """Checks if calculated temperature matches the ISA table values."""
-        altitude = row["H_m"] * ureg.meter
-        expected = ureg.Quantity(row["T_C"], ureg.degC)
-        result = _calculate_atmospheric_temperature(altitude)
+    def test_values_against_isa_table(self):
+        """Checks if calculated temperature matches the ISA table values at all altitudes."""
+        mismatches = [
+            altitude
+            for altitude, expected in zip(ISA_ALTITUDES, ISA_TEMPERATURES)
+            if not math.isclose(
+                _calculate_atmospheric_temperature(altitude).m_as(expected.units),
+                expected.magnitude,
+                abs_tol=0.1,
+            )
+        ]
 
-        assert approx_with_units(result, expected, abs=0.1)
+        assert not mismatches, f"mismatch at altitudes {mismatches}"
 
     def test_output_units(self):
         """Checks that the function returns degrees Celsius."""
         result = _calculate_atmospheric_temperature(0 * ureg.meter)
         assert result.units == ureg.degC
 
-    def test_error_handling(self):
-        """Checks that out-of-bounds altitudes raise ValueError."""
-        with pytest.raises(ValueError, match="Altitude must not be"):
-            _calculate_atmospheric_temperature(-1 * ureg.meter)
-        with pytest.raises(ValueError, match="Altitude must not be"):
-            _calculate_atmospheric_temperature(20001 * ureg.meter)
-
 
 class TestCalculateAtmosphericDensity:
     """Test suite for _calculate_atmospheric_density."""
 
-    @pytest.mark.parametrize("row", ISA_DATA)
-    def test_values_against_isa_table(
-        self,
-        row,
-    ):
-        """Checks if calculated density matches the ISA table values."""
-        altitude = row["H_m"] * ureg.meter
-        expected = row["rho_kg/m^3"] * (ureg.kg / ureg.m**3)
-        result = _calculate_atmospheric_density(altitude)
+    def test_values_against_isa_table(self):
+        """Checks if calculated density matches the ISA table values at all altitudes."""
+        mismatches = [
+            altitude
+            for altitude, expected in zip(ISA_ALTITUDES, ISA_DENSITIES)
+            if not math.isclose(
+                _calculate_atmospheric_density(altitude).m_as(expected.units),
+                expected.magnitude,
+                rel_tol=1e-2,
+            )
+        ]
 
-        assert approx_with_units(result, expected, rel=1e-2)
+        assert not mismatches, f"mismatch at altitudes {mismatches}"
 
     def test_output_units(self):
         """Checks that the function returns kg/m³."""
         result = _calculate_atmospheric_density(0 * ureg.meter)
         assert result.units == ureg.kg / ureg.m**3
 
-    def test_error_handling(self):
-        """Checks that out-of-bounds altitudes raise ValueError."""
-        with pytest.raises(ValueError, match="Altitude must not be"):
-            _calculate_atmospheric_density(-0.1 * ureg.meter)
-        with pytest.raises(ValueError, match="Altitude must not be"):
-            _calculate_atmospheric_density(20000.1 * ureg.meter)
-
 
 class TestCalculateSpeedOfSound:
     """Test suite for _calculate_speed_of_sound."""
 
-    @pytest.mark.parametrize("row", ISA_DATA)
-    def test_values_against_isa_table(
-        self,
-        row,
-    ):
-        """Checks if speed of sound matches ISA table for the given temperature."""
-        temperature = ureg.Quantity(row["T_C"], ureg.degC)
-        expected = (ureg.Quantity(row["a_kt"], ureg.knot)).to(ureg.kph)
-        result = _calculate_speed_of_sound(temperature)
+    def test_values_against_isa_table(self):
+        """Checks if speed of sound matches ISA table for all tabulated temperatures."""
+        mismatches = [
+            temperature
+            for temperature, expected in zip(ISA_TEMPERATURES, ISA_SPEEDS_OF_SOUND)
+            if not math.isclose(
+                _calculate_speed_of_sound(temperature).m_as(expected.units),
+                expected.magnitude,
+                rel_tol=1e-3,
+            )
+        ]
 
-        assert approx_with_units(result, expected, rel=1e-3)
+        assert not mismatches, f"mismatch at temperatures {mismatches}"
 
     def test_output_units(self):
         """Checks that the function returns speed units (kph)."""
@@ -215,36 +167,30 @@ class TestCalculateSpeedOfSound:
 class TestCalculateAircraftVelocity:
     """Test suite for _calculate_airspeed_from_mach."""
 
-    @pytest.mark.parametrize("row", ISA_DATA)
-    def test_values_against_isa_table(
-        self,
-        row,
-    ):
+    def test_values_against_isa_table(self):
         """
         Validates velocity calculation.
         At Mach 1.0, the velocity must equal the local speed of sound from the table.
         """
-        altitude = row["H_m"] * ureg.meter
         mach = 1.0
-        expected = (row["a_kt"] * ureg.knot).to(ureg.kph)
 
-        result = _calculate_airspeed_from_mach(
-            mach,
-            altitude,
-        )
+        mismatches = [
+            altitude
+            for altitude, expected in zip(ISA_ALTITUDES, ISA_SPEEDS_OF_SOUND)
+            if not math.isclose(
+                _calculate_airspeed_from_mach(mach, altitude).m_as(expected.units),
+                expected.magnitude,
+                rel_tol=1e-3,
+            )
+        ]
 
-        assert approx_with_units(result, expected, rel=1e-3)
+        assert not mismatches, f"mismatch at altitudes {mismatches}"
 
     def test_output_units(self):
         """Checks that the function returns speed units (kph)."""
         result = _calculate_airspeed_from_mach(0.8, 10000 * ureg.meter)
         assert result.units == ureg.kph
 
-    def test_error_handling(self):
-        """Checks that invalid inputs raise errors (propagated from atmospheric functions)."""
-        with pytest.raises(ValueError):
-            _calculate_airspeed_from_mach(0.8, -500 * ureg.meter)
-
 
 class TestCalculateDynamicPressure:
     """Test suite for _calculate_dynamic_pressure."""
@@ -257,14 +203,6 @@ class TestCalculateDynamicPressure:
         )
         assert result.units == ureg.pascal
 
-    def test_error_handling(self):
-        """Checks that invalid altitude inputs raise ValueError."""
-        with pytest.raises(ValueError):
-            _calculate_dynamic_pressure(
-                500 * ureg.kph,
-                25000 * ureg.meter,
-            )
-
     def test_calculation_accuracy(self):
         """
         Verifies the math: q = 0.5 * rho * v^2
@@ -288,46 +226,43 @@ class TestCalculateDynamicPressure:
 class TestCalculateMachFromAirspeed:
     """Test suite for _calculate_mach_from_airspeed."""
 
-    @pytest.mark.parametrize("row", ISA_DATA)
-    def test_mach_one_equivalence(
-        self,
-        row,
-    ):
+    def test_mach_one_equivalence(self):
         """
         At Mach 1.0, True Airspeed (TAS) equals the local Speed of Sound.
         We input the speed of sound from the ISA table and expect Mach 1.0 back.
         """
-        altitude = row["H_m"] * ureg.meter
-        # Input speed is the local speed of sound
-        airspeed = (row["a_kt"] * ureg.knot).to(ureg.kph)
-
-        expected_mach = 1.0 * ureg.dimensionless
-
-        result = _calculate_mach_from_airspeed(
-            airspeed,
-            altitude,
-        )
+        mismatches = [
+            altitude
+            for altitude, airspeed in zip(ISA_ALTITUDES, ISA_SPEEDS_OF_SOUND)
+            if not math.isclose(
+                _calculate_mach_from_airspeed(airspeed, altitude).m_as(MACH_ONE.units),
+                MACH_ONE.magnitude,
+                rel_tol=1e-3,
+            )
+        ]
 
-        assert approx_with_units(result, expected_mach, rel=1e-3)
+        assert not mismatches, f"mismatch at altitudes {mismatches}"
 
     def test_round_trip_conversion(self):
         """
         Checks consistency between the two Mach functions:
-        Mach -> Airspeed -> Mach should return the original value.
+        Mach -> Airspeed -> Mach should return the original value,
+        on a grid of Mach numbers and (every 10th) ISA table altitude.
         """
-        original_mach = 0.82
-        altitude = 10500 * ureg.meter
+        original_machs = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.82, 0.9]
 
-        airspeed = _calculate_airspeed_from_mach(original_mach, altitude)
-        result_mach = _calculate_mach_from_airspeed(
-            airspeed,
-            altitude,
-        )
+        for altitude in ISA_ALTITUDES[::10]:
+            for original_mach in original_machs:
+                airspeed = _calculate_airspeed_from_mach(original_mach, altitude)
+                result_mach = _calculate_mach_from_airspeed(
+                    airspeed,
+                    altitude,
+                )
 
-        assert result_mach.units == ureg.dimensionless
-        assert approx_with_units(
-            result_mach, original_mach * ureg.dimensionless, rel=1e-5
-        )
+                assert result_mach.units == ureg.dimensionless
+                assert result_mach.magnitude == pytest.approx(
+                    original_mach, rel=1e-5
+                ), f"at Mach {original_mach} and {altitude}"
 
     def test_output_units(self):
         """Checks that the function returns a dimensionless Quantity."""
@@ -336,7 +271,49 @@ class TestCalculateMachFromAirspeed:
         )
         assert result.units == ureg.dimensionless
 
-    def test_error_handling(self):
-        """Checks that altitude errors propagate correctly."""
-        with pytest.raises(ValueError):
-            _calculate_mach_from_airspeed(500 * ureg.kph, 25000 * ureg.m)
+
+class TestAltitudeBounds:
+    """Test suite for the altitude range check shared by the ISA functions."""
+
+    @pytest.mark.parametrize(
+        "function, altitude",
+        [
+            (_calculate_atmospheric_temperature, -1 * ureg.meter),
+            (_calculate_atmospheric_temperature, 20001 * ureg.meter),
+            (_calculate_atmospheric_density, -0.1 * ureg.meter),
+            (_calculate_atmospheric_density, 20000.1 * ureg.meter),
+            (partial(_calculate_airspeed_from_mach, 0.8), -500 * ureg.meter),
+            (partial(_calculate_dynamic_pressure, 500 * ureg.kph), 25000 * ureg.meter),
+            (
+                partial(_calculate_mach_from_airspeed, 500 * ureg.kph),
+                25000 * ureg.meter,
+            ),
+        ],
+    )
+    def test_error_handling(self, function, altitude):
+        """Checks that out-of-bounds altitudes raise ValueError, also when propagated from atmospheric functions."""
+        with pytest.raises(ValueError, match=ALTITUDE_ERROR):
+            function(altitude=altitude)
+
+
+class TestIsaKernels:
+    """Test suite for the magnitude-only ISA kernels."""
+
+    @pytest.mark.parametrize(
+        "row",
+        range(0, len(ISA_DATA["H_m"]), 50),
+        ids=lambda row: f"h={ISA_DATA['H_m'][row]:g}m",
+    )
+    def test_values_against_isa_table(self, row):
+        """Checks that the kernels match the ISA table values in SI units."""
+        altitude_m = ISA_DATA["H_m"][row]
+
+        assert math.isclose(
+            _isa_temperature(altitude_m), ISA_DATA["T_K"][row], abs_tol=0.1
+        )
+        assert math.isclose(
+            _isa_density(altitude_m), ISA_DATA["rho_kg/m^3"][row], rel_tol=1e-2
+        )
+        assert math.isclose(
+            _isa_speed_of_sound(altitude_m), ISA_DATA["a_m/s"][row], rel_tol=1e-3
+        )
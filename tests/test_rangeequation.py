@@ -6,12 +6,27 @@ from jetfuelburn.rangeequation import (
     calculate_fuel_consumption_breguet_improved,
     calculate_fuel_consumption_stepclimb_arctan,
     calculate_fuel_consumption_stepclimb_integration,
+    _breguet,
+    _integrate_stepclimb,
 )
 from jetfuelburn.utility.tests import approx_with_units
-from jetfuelburn.utility.physics import _calculate_mach_from_airspeed
+from jetfuelburn.utility.physics import (
+    _calculate_airspeed_from_mach,
+    _calculate_mach_from_airspeed,
+)
 from jetfuelburn.utility.aerodynamics import openap_drag_polars
 
-from .fixtures.rangeequation import breguet_range_fuel_calculation_data_1
+from .fixtures.rangeequation import (
+    breguet_range_fuel_calculation_data_1,
+    breguet_base_params,
+    stepclimb_arctan_base_params,
+    stepclimb_integration_base_params,
+)
+
+# Composite units are built once here, not in every test and parametrize case
+TSFC_SI = ureg.mg / ureg.N / ureg.s
+TSFC_IMPERIAL = ureg.lb / ureg.lbf / ureg.hour
+SQUARE_METER = ureg.meter**2
 
 
 class TestCalculateFuelConsumptionBreguet:
@@ -24,7 +39,7 @@ class TestCalculateFuelConsumptionBreguet:
         LD = 18
         m_after = 60 * ureg.metric_ton
         V = 850 * ureg.kph
-        TSFC = 0.6 * (ureg.lb / ureg.lbf / ureg.hour)
+        TSFC = 0.6 * TSFC_IMPERIAL
 
         result = calculate_fuel_consumption_breguet(R, LD, m_after, V, TSFC)
 
@@ -40,7 +55,7 @@ class TestCalculateFuelConsumptionBreguet:
         LD = 18
         m_after = 60000 * ureg.kg
         V = 200 * ureg.meter / ureg.second
-        TSFC = 15 * (ureg.mg / ureg.N / ureg.second)
+        TSFC = 15 * TSFC_SI
 
         result = calculate_fuel_consumption_breguet(R, LD, m_after, V, TSFC)
 
@@ -58,26 +73,19 @@ class TestCalculateFuelConsumptionBreguet:
             },
             {"V": 0 * ureg.kph, "msg": "Cruise speed must be greater than zero"},
             {
-                "TSFC": -5 * (ureg.mg / ureg.N / ureg.s),
+                "TSFC": -5 * TSFC_SI,
                 "msg": "Thrust Specific Fuel Consumption must be greater than zero",
             },
         ],
     )
-    def test_raises_value_error_on_invalid_magnitudes(self, invalid_input):
+    def test_raises_value_error_on_invalid_magnitudes(
+        self, breguet_base_params, invalid_input
+    ):
         """
         Test that specific value errors are raised for physically impossible inputs.
         """
-        # Default valid values
-        params = {
-            "R": 2000 * ureg.nmi,
-            "LD": 18,
-            "m_after_cruise": 100 * ureg.metric_ton,
-            "V": 800 * ureg.kph,
-            "TSFC": 17 * (ureg.mg / ureg.N / ureg.s),
-        }
-
-        expected_msg = invalid_input.pop("msg")
-        params.update(invalid_input)
+        params = {**breguet_base_params, **invalid_input}
+        expected_msg = params.pop("msg")
 
         with pytest.raises(ValueError, match=expected_msg):
             calculate_fuel_consumption_breguet(**params)
@@ -129,7 +137,7 @@ class TestCalculateFuelConsumptionBreguetImproved:
         m_after = 80000 * ureg.kg
         V = 450 * ureg.knot
         V_hw = 20 * ureg.knot
-        TSFC = 0.55 * (ureg.lb / ureg.lbf / ureg.hour)
+        TSFC = 0.55 * TSFC_IMPERIAL
 
         result = calculate_fuel_consumption_breguet_improved(
             R, LD, m_after, V, V_hw, TSFC
@@ -147,7 +155,7 @@ class TestCalculateFuelConsumptionBreguetImproved:
             m_after_cruise=50000 * ureg.kg,
             V=800 * ureg.kph,
             V_headwind=0 * ureg.kph,
-            TSFC=17 * (ureg.mg / ureg.N / ureg.s),
+            TSFC=17 * TSFC_SI,
         )
         assert result.magnitude == 0
 
@@ -161,7 +169,7 @@ class TestCalculateFuelConsumptionBreguetImproved:
         LD = 19.5
         m_after = 120 * ureg.metric_ton
         V = 230 * ureg.meter / ureg.second
-        TSFC = 16 * (ureg.mg / ureg.N / ureg.second)
+        TSFC = 16 * TSFC_SI
 
         # 1. Standard Calculation
         val_standard = calculate_fuel_consumption_breguet(
@@ -194,39 +202,25 @@ class TestCalculateFuelConsumptionBreguetImproved:
                 m_after_cruise=100 * ureg.kg,
                 V=800 * ureg.kph,
                 V_headwind=50 * ureg.gram,  # Invalid: Mass instead of Speed
-                TSFC=17 * (ureg.mg / ureg.N / ureg.s),
+                TSFC=17 * TSFC_SI,
             )
 
 
 class TestCalculateFuelConsumptionStepclimbArctan:
 
-    def test_valid_input_units(self):
+    def test_valid_input_units(self, stepclimb_arctan_base_params):
         """Test valid calculation for the arctan method."""
         result = calculate_fuel_consumption_stepclimb_arctan(
-            R=2000 * ureg.nmi,
-            h=35000 * ureg.feet,
-            K=0.045,
-            C_D0=0.02,
-            m_after_cruise=100 * ureg.metric_ton,
-            S=122.6 * ureg.meter**2,
-            V=800 * ureg.kph,
-            TSFC=17 * (ureg.mg / ureg.N / ureg.s),
+            **stepclimb_arctan_base_params
         )
         assert result.check("[mass]")
         assert result.units == ureg.kg
         assert result.magnitude > 0
 
-    def test_zero_range(self):
+    def test_zero_range(self, stepclimb_arctan_base_params):
         """Test zero range returns zero mass."""
         result = calculate_fuel_consumption_stepclimb_arctan(
-            R=0 * ureg.nmi,
-            h=35000 * ureg.feet,
-            K=0.045,
-            C_D0=0.02,
-            m_after_cruise=100 * ureg.metric_ton,
-            S=122.6 * ureg.meter**2,
-            V=800 * ureg.kph,
-            TSFC=17 * (ureg.mg / ureg.N / ureg.s),
+            **{**stepclimb_arctan_base_params, "R": 0 * ureg.nmi}
         )
         assert result.magnitude == 0
 
@@ -240,30 +234,21 @@ class TestCalculateFuelConsumptionStepclimbArctan:
                 "msg": "Mass after cruise must be greater than zero",
             },
             {
-                "S": 1.0 * ureg.m**2,
+                "S": 1.0 * SQUARE_METER,
                 "msg": "Lift-to-Drag ratio must be greater than 1",
             },  # Error msg corresponds to check S<=1 in source
             {"V": 0 * ureg.kph, "msg": "Cruise speed must be greater than zero"},
             {
-                "TSFC": -5 * (ureg.mg / ureg.N / ureg.s),
+                "TSFC": -5 * TSFC_SI,
                 "msg": "Thrust Specific Fuel Consumption must be greater than zero",
             },
         ],
     )
-    def test_raises_value_error_on_invalid_magnitudes(self, invalid_input):
-        params = {
-            "R": 2000 * ureg.nmi,
-            "h": 35000 * ureg.feet,
-            "K": 0.045,
-            "C_D0": 0.02,
-            "m_after_cruise": 100 * ureg.metric_ton,
-            "S": 122.6 * ureg.meter**2,
-            "V": 800 * ureg.kph,
-            "TSFC": 17 * (ureg.mg / ureg.N / ureg.s),
-        }
-
-        expected_msg = invalid_input.pop("msg")
-        params.update(invalid_input)
+    def test_raises_value_error_on_invalid_magnitudes(
+        self, stepclimb_arctan_base_params, invalid_input
+    ):
+        params = {**stepclimb_arctan_base_params, **invalid_input}
+        expected_msg = params.pop("msg")
 
         with pytest.raises(ValueError, match=expected_msg):
             calculate_fuel_consumption_stepclimb_arctan(**params)
@@ -271,15 +256,10 @@ class TestCalculateFuelConsumptionStepclimbArctan:
 
 class TestCalculateFuelConsumptionStepclimbIntegration:
 
-    def test_valid_input_scalar(self):
+    def test_valid_input_scalar(self, stepclimb_integration_base_params):
         """Test integration method with scalar TSFC and LD inputs."""
         result = calculate_fuel_consumption_stepclimb_integration(
-            m_after_cruise=100 * ureg.metric_ton,
-            R=2000 * ureg.nmi,
-            h=35000 * ureg.feet,
-            M=0.78,
-            TSFC=17 * (ureg.mg / ureg.N / ureg.s),
-            LD=18,
+            **stepclimb_integration_base_params
         )
         assert result.check("[mass]")
         assert result.units == ureg.kg
@@ -290,7 +270,7 @@ class TestCalculateFuelConsumptionStepclimbIntegration:
 
         # Define callables that accept specific arguments as required by _validate_physics_function_parameters
         def mock_tsfc(M, h):
-            return 17 * (ureg.mg / ureg.N / ureg.s)
+            return 17 * TSFC_SI
 
         def mock_ld(L, M, h):
             return 18
@@ -322,32 +302,19 @@ class TestCalculateFuelConsumptionStepclimbIntegration:
             {"h": -100 * ureg.ft, "msg": "Altitude must be non-negative"},
         ],
     )
-    def test_raises_value_error_on_invalid_magnitudes(self, invalid_input):
-        params = {
-            "m_after_cruise": 100 * ureg.metric_ton,
-            "R": 2000 * ureg.nmi,
-            "h": 35000 * ureg.feet,
-            "M": 0.78,
-            "TSFC": 17 * (ureg.mg / ureg.N / ureg.s),
-            "LD": 18,
-            "integration_mass_step": 100 * ureg.kg,
-        }
-
-        expected_msg = invalid_input.pop("msg")
-        params.update(invalid_input)
+    def test_raises_value_error_on_invalid_magnitudes(
+        self, stepclimb_integration_base_params, invalid_input
+    ):
+        params = {**stepclimb_integration_base_params, **invalid_input}
+        expected_msg = params.pop("msg")
 
         with pytest.raises(ValueError, match=expected_msg):
             calculate_fuel_consumption_stepclimb_integration(**params)
 
-    def test_zero_range(self):
+    def test_zero_range(self, stepclimb_integration_base_params):
         """Test zero range integration returns zero fuel mass."""
         result = calculate_fuel_consumption_stepclimb_integration(
-            m_after_cruise=100 * ureg.metric_ton,
-            R=0 * ureg.nmi,
-            h=35000 * ureg.feet,
-            M=0.78,
-            TSFC=17 * (ureg.mg / ureg.N / ureg.s),
-            LD=18,
+            **{**stepclimb_integration_base_params, "R": 0 * ureg.nmi}
         )
         assert result.magnitude == 0
 
@@ -359,33 +326,49 @@ class TestCalculateFuelConsumptionStepclimbIntegration:
                 R=2000 * ureg.nmi,
                 h=35000 * ureg.feet,
                 M=0.78,
-                TSFC=17 * (ureg.mg / ureg.N / ureg.s),
+                TSFC=17 * TSFC_SI,
                 LD=18,
             )
 
-    def test_integration_convergence(self):
-        """Test that the integration method converges to a reasonable value as integration_mass_step decreases."""
+    def test_integration_convergence(self, stepclimb_integration_base_params):
+        """
+        Test that the integration method converges as integration_mass_step decreases.
+
+        The result for the default step of 100 kg is compared against a reference
+        computed with a ten times finer step.
+        """
         base_result = calculate_fuel_consumption_stepclimb_integration(
-            m_after_cruise=100 * ureg.metric_ton,
-            R=2000 * ureg.nmi,
-            h=35000 * ureg.feet,
-            M=0.78,
-            TSFC=17 * (ureg.mg / ureg.N / ureg.s),
-            LD=18,
-            integration_mass_step=100 * ureg.kg,
+            **{
+                **stepclimb_integration_base_params,
+                "integration_mass_step": 100 * ureg.kg,
+            }
         )
 
-        finer_result = calculate_fuel_consumption_stepclimb_integration(
-            m_after_cruise=100 * ureg.metric_ton,
-            R=2000 * ureg.nmi,
-            h=35000 * ureg.feet,
-            M=0.78,
-            TSFC=17 * (ureg.mg / ureg.N / ureg.s),
-            LD=18,
-            integration_mass_step=10 * ureg.kg,
+        reference_result = calculate_fuel_consumption_stepclimb_integration(
+            **{
+                **stepclimb_integration_base_params,
+                "integration_mass_step": 10 * ureg.kg,
+            }
+        )
+
+        assert approx_with_units(base_result, reference_result, rel=1e-5)
+
+    def test_equivalence_to_breguet_for_constant_inputs(
+        self, stepclimb_integration_base_params
+    ):
+        """Test that with constant TSFC and LD, the integration method reproduces the Breguet range equation."""
+        params = stepclimb_integration_base_params
+
+        breguet_result = calculate_fuel_consumption_breguet(
+            R=params["R"],
+            LD=params["LD"],
+            m_after_cruise=params["m_after_cruise"],
+            V=_calculate_airspeed_from_mach(params["M"], params["h"]),
+            TSFC=params["TSFC"],
         )
+        integration_result = calculate_fuel_consumption_stepclimb_integration(**params)
 
-        assert approx_with_units(finer_result, base_result, rel=0.01)
+        assert approx_with_units(integration_result, breguet_result, rel=1e-6)
 
     def test_equivalence_to_arctan_method(self):
         """Test that the integration method gives a similar result to the arctan method for the same inputs."""
@@ -394,15 +377,16 @@ class TestCalculateFuelConsumptionStepclimbIntegration:
         altitude = 35000 * ureg.ft
         mach = _calculate_mach_from_airspeed(airspeed, altitude)
         m_after_cruise = 100 * ureg.metric_ton
-        TSFC = 17 * (ureg.mg / ureg.N / ureg.s)
+        TSFC = 17 * TSFC_SI
+        drag_parameters = openap_drag_polars.get_basic_drag_parameters("A320")
 
         arctan_result = calculate_fuel_consumption_stepclimb_arctan(
             R=range,
             h=altitude,
-            K=openap_drag_polars.get_basic_drag_parameters("A320").get("K"),
-            C_D0=openap_drag_polars.get_basic_drag_parameters("A320").get("CD0"),
+            K=drag_parameters["K"],
+            C_D0=drag_parameters["CD0"],
             m_after_cruise=m_after_cruise,
-            S=openap_drag_polars.get_basic_drag_parameters("A320").get("S"),
+            S=drag_parameters["S"],
             V=airspeed,
             TSFC=TSFC,
         )
@@ -418,3 +402,23 @@ class TestCalculateFuelConsumptionStepclimbIntegration:
         )
 
         assert approx_with_units(integration_result, arctan_result, rel=0.05)
+
+
+class TestRangeEquationKernels:
+    """Test suite for the magnitude-only (SI float) range equation kernels."""
+
+    # L/D 18, 100 t, 230 m/s, 17 mg/(N*s)
+    LD = 18.0
+    m_after_cruise = 100000.0
+    V = 230.0
+    TSFC = 17e-6
+
+    def test_zero_range(self):
+        """Checks that both kernels return zero fuel for zero range."""
+        assert _breguet(0.0, self.LD, self.m_after_cruise, self.V, self.TSFC) == 0
+        assert (
+            _integrate_stepclimb(
+                self.m_after_cruise, 0.0, self.V, self.TSFC, lambda m: self.LD, 100.0
+            )
+            == 0
+        )
@@ -3,6 +3,17 @@ from jetfuelburn import ureg
 from jetfuelburn.utility.tests import approx_with_units
 from jetfuelburn.statistics import usdot, aeromaps
 
+# AeroMaps 2005 medium-range energy intensity [MJ/km] over 1000 km,
+# divided by the specific energy of jet fuel [MJ/kg] used by the model
+EXPECTED_MEDIUM_RANGE_2005 = ureg.Quantity(1.289274036 * 1000 / 43.15, ureg.kg)
+
+# Shared usdot error-handling inputs and messages
+RANGE = 100 * ureg.km
+WEIGHT = 1000 * ureg.kg
+NEGATIVE_INPUT_ERROR = "Range and/or weight must not be negative."
+YEAR_ERROR = "No data available for year '1800'."
+AIRCRAFT_ERROR = "US DOT Aircraft Designator 'ufo' not found in model data."
+
 
 class TestUsdot:
 
@@ -43,52 +54,34 @@ class TestUsdot:
         assert fuel.magnitude > 0
         assert fuel.units == ureg.kg
 
-    def test_fuel_consumption_per_weight_error_handling(self):
+    @pytest.mark.parametrize(
+        "year, acft, R, W, msg",
+        [
+            (2024, "B787-800 Dreamliner", -RANGE, WEIGHT, NEGATIVE_INPUT_ERROR),
+            (2024, "B787-800 Dreamliner", RANGE, -WEIGHT, NEGATIVE_INPUT_ERROR),
+            (1800, "B787-800 Dreamliner", RANGE, WEIGHT, YEAR_ERROR),
+            (2024, "ufo", RANGE, WEIGHT, AIRCRAFT_ERROR),
+        ],
+        ids=["negative_range", "negative_weight", "year", "aircraft"],
+    )
+    def test_fuel_consumption_per_weight_error_handling(self, year, acft, R, W, msg):
         """Test error handling for fuel consumption per weight."""
-        with pytest.raises(
-            ValueError, match="Range and/or weight must not be negative."
-        ):
-            usdot.calculate_fuel_consumption_per_weight(
-                2024, "B787-800 Dreamliner", -100 * ureg.km, 1000 * ureg.kg
-            )
-
-        with pytest.raises(
-            ValueError, match="Range and/or weight must not be negative."
-        ):
-            usdot.calculate_fuel_consumption_per_weight(
-                2024, "B787-800 Dreamliner", 100 * ureg.km, -1000 * ureg.kg
-            )
-
-        with pytest.raises(ValueError, match="No data available for year '1800'."):
-            usdot.calculate_fuel_consumption_per_weight(
-                1800, "B787-800 Dreamliner", 100 * ureg.km, 1000 * ureg.kg
-            )
-
-        with pytest.raises(
-            ValueError,
-            match="US DOT Aircraft Designator 'ufo' not found in model data.",
-        ):
-            usdot.calculate_fuel_consumption_per_weight(
-                2024, "ufo", 100 * ureg.km, 1000 * ureg.kg
-            )
-
-    def test_fuel_consumption_per_seat_error_handling(self):
+        with pytest.raises(ValueError, match=msg):
+            usdot.calculate_fuel_consumption_per_weight(year, acft, R, W)
+
+    @pytest.mark.parametrize(
+        "year, acft, R, msg",
+        [
+            (2024, "B787-800 Dreamliner", -RANGE, "Range must not be negative."),
+            (1800, "B787-800 Dreamliner", RANGE, YEAR_ERROR),
+            (2024, "ufo", RANGE, AIRCRAFT_ERROR),
+        ],
+        ids=["negative_range", "year", "aircraft"],
+    )
+    def test_fuel_consumption_per_seat_error_handling(self, year, acft, R, msg):
         """Test error handling for fuel consumption per seat."""
-        with pytest.raises(ValueError, match="Range must not be negative."):
-            usdot.calculate_fuel_consumption_per_seat(
-                2024, "B787-800 Dreamliner", -100 * ureg.km
-            )
-
-        with pytest.raises(ValueError, match="No data available for year '1800'."):
-            usdot.calculate_fuel_consumption_per_seat(
-                1800, "B787-800 Dreamliner", 100 * ureg.km
-            )
-
-        with pytest.raises(
-            ValueError,
-            match="US DOT Aircraft Designator 'ufo' not found in model data.",
-        ):
-            usdot.calculate_fuel_consumption_per_seat(2024, "ufo", 100 * ureg.km)
+        with pytest.raises(ValueError, match=msg):
+            usdot.calculate_fuel_consumption_per_seat(year, acft, R)
 
 
 class TestAeroMaps:
@@ -115,11 +108,7 @@ class TestAeroMaps:
 
         fuel_actual = aeromaps.calculate_fuel_consumption(acft, year, dist)
 
-        expected_val = (
-            1.289274036 * ureg("MJ/km") * 1000 * ureg("km") / 43.15 / ureg("MJ/kg")
-        )
-
-        assert approx_with_units(fuel_actual, expected_val, rel=1e-4)
+        assert approx_with_units(fuel_actual, EXPECTED_MEDIUM_RANGE_2005, rel=1e-4)
 
     def test_unit_conversion_consistency(self):
         """Test that the function handles unit conversion (nmi to km) correctly."""
@@ -107,3 +107,42 @@ def test_approx_dict_of_dict():
         dict_of_dict_expected={"a": {"b": 1.0}},
         abs=0.1,
     )
+    assert approx_dict_of_dict(
+        dict_of_dict_check={"a": {"b": 1.001 * ureg.m, "c": 2.0}, "d": {"e": 3.0}},
+        dict_of_dict_expected={"a": {"b": 1.0 * ureg.m, "c": 2.0}, "d": {"e": 3.0}},
+        rel=1e-3,
+    )
+    assert not approx_dict_of_dict(
+        dict_of_dict_check={"a": {"b": 1.0 * ureg.m}, "d": {"e": 3.1}},
+        dict_of_dict_expected={"a": {"b": 1.0 * ureg.m}, "d": {"e": 3.0}},
+        rel=1e-3,
+    )
+    assert not approx_dict_of_dict(
+        dict_of_dict_check={"a": {"b": 1.0}},
+        dict_of_dict_expected={"a": {"b": 1.0 * ureg.m}},
+        rel=1e-3,
+    )
+    assert approx_dict_of_dict(
+        dict_of_dict_check={"a": {"x": [1.001, 2.0]}},
+        dict_of_dict_expected={"a": {"x": [1.0, 2.0]}},
+        rel=1e-3,
+    )
+    assert not approx_dict_of_dict(
+        dict_of_dict_check={"a": {"x": [1.1, 2.0]}},
+        dict_of_dict_expected={"a": {"x": [1.0, 2.0]}},
+        rel=1e-3,
+    )
+
+
+def test_approx_dict_of_dict_array_quantities():
+    np = pytest.importorskip("numpy")
+    assert approx_dict_of_dict(
+        dict_of_dict_check={"a": {"x": np.array([1.001, 2.0]) * ureg.m}},
+        dict_of_dict_expected={"a": {"x": np.array([1.0, 2.0]) * ureg.m}},
+        rel=1e-3,
+    )
+    assert not approx_dict_of_dict(
+        dict_of_dict_check={"a": {"x": np.array([1.1, 2.0]) * ureg.m}},
+        dict_of_dict_expected={"a": {"x": np.array([1.0, 2.0]) * ureg.m}},
+        rel=1e-3,
+    )